@@ -4,6 +4,8 @@ import (
 	"context"
 	"fmt"
 	"net/http"
+	"regexp"
+	"strings"
 
 	"github.com/cyw0ng95/v2e/pkg/common"
 	"github.com/cyw0ng95/v2e/pkg/proc/subprocess"
@@ -12,13 +14,65 @@ import (
 
 // HTTP response helpers for reducing boilerplate in handlers
 
+// Stable machine-readable codes attached to error responses so clients can
+// branch on a field instead of parsing prose.
+const (
+	ErrorCodeNVDRateLimited = "NVD_RATE_LIMITED"
+	ErrorCodeMissingParam   = "MISSING_PARAM"
+	ErrorCodeCVENotFound    = "CVE_NOT_FOUND"
+	ErrorCodeFetchFailed    = "FETCH_FAILED"
+)
+
+// http429Re matches 429 only as a standalone token: a bare substring
+// check would fire on the digits inside ordinary CVE ids (e.g.
+// "CVE-2021-42915 not found") and misclassify them as throttling.
+var http429Re = regexp.MustCompile(`\b429\b`)
+
+// errorCodeFor maps well-known backend error messages to stable codes.
+// Classification order matters: throttling is checked first because NVD
+// 429 messages can also mention the failed fetch. The remote service
+// already stamps NVD_RATE_LIMITED into its error text, so the 429 token
+// match is only a fallback for upstream messages built elsewhere.
+func errorCodeFor(message string) string {
+	lower := strings.ToLower(message)
+	switch {
+	case strings.Contains(message, "NVD_RATE_LIMITED") || http429Re.MatchString(message):
+		return ErrorCodeNVDRateLimited
+	case strings.Contains(lower, "is required"):
+		return ErrorCodeMissingParam
+	case strings.Contains(lower, "not found"):
+		return ErrorCodeCVENotFound
+	case strings.Contains(lower, "failed to fetch"):
+		return ErrorCodeFetchFailed
+	}
+	return ""
+}
+
 // httpErrorResponse sends an error response with given code and message.
 func httpErrorResponse(c *gin.Context, code int, message string) {
-	c.JSON(code, gin.H{
+	body := gin.H{
 		"retcode": code,
 		"message": message,
 		"payload": nil,
-	})
+	}
+	if errorCode := errorCodeFor(message); errorCode != "" {
+		body["error_code"] = errorCode
+	}
+	c.JSON(code, body)
+}
+
+// batchEntryError builds one error element of a batched RPC response,
+// mirroring the envelope httpErrorResponse sends for single calls.
+func batchEntryError(message string) gin.H {
+	entry := gin.H{
+		"retcode": http.StatusInternalServerError,
+		"message": message,
+		"payload": nil,
+	}
+	if errorCode := errorCodeFor(message); errorCode != "" {
+		entry["error_code"] = errorCode
+	}
+	return entry
 }
 
 // httpSuccessResponse sends a success response with given payload.
@@ -40,6 +94,70 @@ func registerHandlers(restful *gin.RouterGroup, rpcClient *RPCClient) {
 		})
 	})
 
+	// Batched RPC forwarding endpoint: one HTTP envelope carries several
+	// RPC requests, saving a round trip (and request parsing) per entry.
+	// Entries are dispatched in order and the response array is
+	// index-aligned with the request array; a failing entry yields an
+	// error element without aborting the rest of the batch.
+	restful.POST("/rpc/batch", func(c *gin.Context) {
+		common.Debug(LogMsgHTTPRequestReceived, c.Request.Method, c.Request.URL.Path)
+
+		var requests []struct {
+			Method string                 `json:"method" binding:"required"`
+			Params map[string]interface{} `json:"params"`
+			Target string                 `json:"target"`
+		}
+
+		if err := c.ShouldBindJSON(&requests); err != nil {
+			common.Warn(LogMsgRequestParsingError, err)
+			httpErrorResponse(c, http.StatusBadRequest, fmt.Sprintf("Invalid request: %v", err))
+			return
+		}
+
+		results := make([]gin.H, 0, len(requests))
+		for _, request := range requests {
+			target := request.Target
+			if target == "" {
+				target = "broker"
+			}
+
+			common.Info(LogMsgRPCForwardingStarted, request.Method, target)
+			rpcCtx, cancel := context.WithTimeout(context.Background(), rpcClient.rpcTimeout)
+			response, err := rpcClient.InvokeRPCWithTarget(rpcCtx, target, request.Method, request.Params)
+			cancel()
+
+			if err != nil {
+				common.Error(LogMsgRPCForwardingError, err)
+				results = append(results, batchEntryError(fmt.Sprintf("RPC error: %v", err)))
+				continue
+			}
+
+			if isError, errMsg := subprocess.IsErrorResponse(response); isError {
+				common.Warn("RPC response is an error: %s", errMsg)
+				results = append(results, batchEntryError(errMsg))
+				continue
+			}
+
+			var payload interface{}
+			if response.Payload != nil {
+				if err := subprocess.UnmarshalFast(response.Payload, &payload); err != nil {
+					common.Error(LogMsgRPCResponseParseError, err)
+					results = append(results, batchEntryError(fmt.Sprintf("Failed to parse response: %v", err)))
+					continue
+				}
+			}
+
+			results = append(results, gin.H{
+				"retcode": 0,
+				"message": "success",
+				"payload": payload,
+			})
+		}
+
+		c.JSON(http.StatusOK, results)
+		common.Debug(LogMsgHTTPRequestProcessed, c.Request.Method, c.Request.URL.Path, http.StatusOK)
+	})
+
 	// Generic RPC forwarding endpoint
 	restful.POST("/rpc", func(c *gin.Context) {
 		common.Debug(LogMsgHTTPRequestReceived, c.Request.Method, c.Request.URL.Path)
@@ -222,3 +222,28 @@ func TestRPCHandler_DefaultTargetBroker(t *testing.T) {
 	})
 
 }
+
+// Test the error-code classifier, in particular that the digits of an
+// ordinary CVE id are not mistaken for an HTTP 429
+func TestErrorCodeFor(t *testing.T) {
+	tests := []struct {
+		name    string
+		message string
+		want    string
+	}{
+		{"stable rate limit code", "NVD_RATE_LIMITED: NVD API rate limit exceeded (HTTP 429)", ErrorCodeNVDRateLimited},
+		{"bare 429 token", "upstream returned 429", ErrorCodeNVDRateLimited},
+		{"429 inside a CVE id", "failed to fetch CVE-2021-42915: not found", ErrorCodeCVENotFound},
+		{"missing param", "meta: cve_id is required", ErrorCodeMissingParam},
+		{"not found", "CVE CVE-9999-99999 not found", ErrorCodeCVENotFound},
+		{"fetch failed", "failed to fetch CVE data", ErrorCodeFetchFailed},
+		{"unclassified", "something else went wrong", ""},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := errorCodeFor(tt.message); got != tt.want {
+				t.Fatalf("errorCodeFor(%q) = %q, want %q", tt.message, got, tt.want)
+			}
+		})
+	}
+}
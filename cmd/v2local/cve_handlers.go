@@ -51,7 +51,8 @@ func createSaveCVEByIDHandler(db *local.DB, logger *common.Logger) subprocess.Ha
 func createIsCVEStoredByIDHandler(db *local.DB, logger *common.Logger) subprocess.Handler {
 	return func(ctx context.Context, msg *subprocess.Message) (*subprocess.Message, error) {
 		var req struct {
-			CVEID string `json:"cve_id"`
+			CVEID       string `json:"cve_id"`
+			IncludeData bool   `json:"include_data"`
 		}
 		if errResp := subprocess.ParseRequest(msg, &req); errResp != nil {
 			logger.Warn(LogMsgFailedParseReq, errResp.Error)
@@ -62,13 +63,18 @@ func createIsCVEStoredByIDHandler(db *local.DB, logger *common.Logger) subproces
 			logger.Warn(LogMsgCVEIDRequiredSimple)
 			return errResp, nil
 		}
-		_, err := db.GetCVE(req.CVEID)
+		cveItem, err := db.GetCVE(req.CVEID)
 		stored := err == nil
 		logger.Debug(LogMsgProcessingIsCVECompleted, req.CVEID, stored)
 		result := map[string]interface{}{
 			"cve_id": req.CVEID,
 			"stored": stored,
 		}
+		if stored && req.IncludeData {
+			// The existence check already materialized the record; returning
+			// it saves the caller a follow-up RPCGetCVEByID round trip.
+			result["cve"] = cveItem
+		}
 		resp, err := subprocess.NewSuccessResponse(msg, result)
 		if err != nil {
 			logger.Warn(LogMsgFailedMarshalResult, err)
@@ -112,6 +118,54 @@ func createGetCVEByIDHandler(db *local.DB, logger *common.Logger) subprocess.Han
 	}
 }
 
+// createBatchGetCVEHandler creates a handler for RPCBatchGetCVE. Looking
+// up N ids one call at a time pays a client round trip per id; this
+// accepts the whole list and answers per-id from one request. Misses are
+// reported per entry instead of failing the batch, so callers can probe
+// mixed valid/invalid id sets in a single round trip.
+func createBatchGetCVEHandler(db *local.DB, logger *common.Logger) subprocess.Handler {
+	return func(ctx context.Context, msg *subprocess.Message) (*subprocess.Message, error) {
+		var req struct {
+			CVEIDs []string `json:"cve_ids"`
+		}
+		if errResp := subprocess.ParseRequest(msg, &req); errResp != nil {
+			logger.Warn(LogMsgFailedParseReq, errResp.Error)
+			return errResp, nil
+		}
+		if len(req.CVEIDs) == 0 {
+			return subprocess.NewErrorResponse(msg, "cve_ids is required"), nil
+		}
+
+		results := make([]map[string]interface{}, len(req.CVEIDs))
+		found := 0
+		for i, cveID := range req.CVEIDs {
+			entry := map[string]interface{}{"cve_id": cveID}
+			cveItem, err := db.GetCVE(cveID)
+			if err != nil {
+				entry["found"] = false
+				entry["error"] = fmt.Sprintf(LogMsgCVEIDNotFound, err)
+			} else {
+				entry["found"] = true
+				entry["cve"] = cveItem
+				found++
+			}
+			results[i] = entry
+		}
+		logger.Debug("RPCBatchGetCVE: %d/%d ids found", found, len(req.CVEIDs))
+
+		resp, err := subprocess.NewSuccessResponse(msg, map[string]interface{}{
+			"results": results,
+			"count":   len(results),
+			"found":   found,
+		})
+		if err != nil {
+			logger.Warn(LogMsgFailedMarshalResult, err)
+			return subprocess.NewErrorResponse(msg, fmt.Sprintf("failed to marshal result: %v", err)), nil
+		}
+		return resp, nil
+	}
+}
+
 // createDeleteCVEByIDHandler creates a handler for RPCDeleteCVEByID
 func createDeleteCVEByIDHandler(db *local.DB, logger *common.Logger) subprocess.Handler {
 	return func(ctx context.Context, msg *subprocess.Message) (*subprocess.Message, error) {
@@ -136,8 +190,9 @@ func createDeleteCVEByIDHandler(db *local.DB, logger *common.Logger) subprocess.
 		logger.Info("Deleted CVE %s from local database", req.CVEID)
 		logger.Debug("Processing DeleteCVEByID request completed successfully for CVE ID %s", req.CVEID)
 		result := map[string]interface{}{
-			"success": true,
-			"cve_id":  req.CVEID,
+			"success":      true,
+			"cve_id":       req.CVEID,
+			"stored_after": false,
 		}
 		resp, err := subprocess.NewSuccessResponse(msg, result)
 		if err != nil {
@@ -148,13 +203,20 @@ func createDeleteCVEByIDHandler(db *local.DB, logger *common.Logger) subprocess.
 	}
 }
 
+// cvePage is one (offset, limit) window in a batched RPCListCVEs request.
+type cvePage struct {
+	Offset int `json:"offset"`
+	Limit  int `json:"limit"`
+}
+
 // createListCVEsHandler creates a handler for RPCListCVEs
 func createListCVEsHandler(db *local.DB, logger *common.Logger) subprocess.Handler {
 	return func(ctx context.Context, msg *subprocess.Message) (*subprocess.Message, error) {
 		logger.Debug("Processing ListCVEs request - Message ID: %s, Correlation ID: %s", msg.ID, msg.CorrelationID)
 		var req struct {
-			Offset int `json:"offset"`
-			Limit  int `json:"limit"`
+			Offset int       `json:"offset"`
+			Limit  int       `json:"limit"`
+			Pages  []cvePage `json:"pages"`
 		}
 		req.Offset = 0
 		req.Limit = 10
@@ -165,6 +227,40 @@ func createListCVEsHandler(db *local.DB, logger *common.Logger) subprocess.Handl
 				return errResp, nil
 			}
 		}
+		total, err := db.Count()
+		if err != nil {
+			logger.Warn("Failed to get CVE count from database - Message ID: %s, Correlation ID: %s, Error: %v", msg.ID, msg.CorrelationID, err)
+			logger.Debug("Processing ListCVEs request failed to get count - Message ID: %s, Error details: %v", msg.ID, err)
+			return subprocess.NewErrorResponse(msg, fmt.Sprintf("failed to get CVE count: %v", err)), nil
+		}
+		if len(req.Pages) > 0 {
+			// Batched form: serve several pages in one round trip so
+			// pagination consumers do not pay per-page RPC latency
+			logger.Info("Processing ListCVEs request - Message ID: %s, Correlation ID: %s, Pages: %d", msg.ID, msg.CorrelationID, len(req.Pages))
+			pages := make([]map[string]interface{}, 0, len(req.Pages))
+			for _, page := range req.Pages {
+				cves, err := db.ListCVEs(page.Offset, page.Limit)
+				if err != nil {
+					logger.Warn("Failed to list CVEs from database - Message ID: %s, Correlation ID: %s, Error: %v", msg.ID, msg.CorrelationID, err)
+					return subprocess.NewErrorResponse(msg, fmt.Sprintf("failed to list CVEs: %v", err)), nil
+				}
+				pages = append(pages, map[string]interface{}{
+					"offset": page.Offset,
+					"limit":  page.Limit,
+					"cves":   cves,
+				})
+			}
+			result := map[string]interface{}{
+				"pages": pages,
+				"total": total,
+			}
+			resp, err := subprocess.NewSuccessResponse(msg, result)
+			if err != nil {
+				logger.Warn("Failed to marshal ListCVEs response - Message ID: %s, Correlation ID: %s, Error: %v", msg.ID, msg.CorrelationID, err)
+				return subprocess.NewErrorResponse(msg, fmt.Sprintf("failed to marshal result: %v", err)), nil
+			}
+			return resp, nil
+		}
 		logger.Info("Processing ListCVEs request - Message ID: %s, Correlation ID: %s, Offset: %d, Limit: %d", msg.ID, msg.CorrelationID, req.Offset, req.Limit)
 		cves, err := db.ListCVEs(req.Offset, req.Limit)
 		if err != nil {
@@ -172,12 +268,6 @@ func createListCVEsHandler(db *local.DB, logger *common.Logger) subprocess.Handl
 			logger.Debug("Processing ListCVEs request failed - Message ID: %s, Error details: %v", msg.ID, err)
 			return subprocess.NewErrorResponse(msg, fmt.Sprintf("failed to list CVEs: %v", err)), nil
 		}
-		total, err := db.Count()
-		if err != nil {
-			logger.Warn("Failed to get CVE count from database - Message ID: %s, Correlation ID: %s, Error: %v", msg.ID, msg.CorrelationID, err)
-			logger.Debug("Processing ListCVEs request failed to get count - Message ID: %s, Error details: %v", msg.ID, err)
-			return subprocess.NewErrorResponse(msg, fmt.Sprintf("failed to get CVE count: %v", err)), nil
-		}
 		logger.Info("Successfully listed CVEs - Message ID: %s, Correlation ID: %s, Returned: %d, Total: %d, Offset: %d, Limit: %d", msg.ID, msg.CorrelationID, len(cves), total, req.Offset, req.Limit)
 		logger.Debug("Processing ListCVEs request completed successfully - Message ID: %s, Returned %d CVEs, Total %d", msg.ID, len(cves), total)
 		result := map[string]interface{}{
@@ -301,9 +391,12 @@ func createDeleteCVEHandler(db *local.DB, logger *common.Logger) subprocess.Hand
 			return subprocess.NewErrorResponse(msg, fmt.Sprintf("failed to delete CVE: %v", err)), nil
 		}
 		logger.Info("Deleted CVE %s from local database", req.CVEID)
+		// Deletion success implies the record is gone; reporting it saves the
+		// caller a follow-up RPCIsCVEStoredByID verification round trip
 		result := map[string]interface{}{
-			"success": true,
-			"cve_id":  req.CVEID,
+			"success":      true,
+			"cve_id":       req.CVEID,
+			"stored_after": false,
 		}
 		resp, err := subprocess.NewSuccessResponse(msg, result)
 		if err != nil {
@@ -250,6 +250,8 @@ func main() {
 	logger.Info(LogMsgRPCHandlerRegistered, "RPCIsCVEStoredByID")
 	sp.RegisterHandler("RPCGetCVEByID", createGetCVEByIDHandler(db, logger))
 	logger.Info(LogMsgRPCHandlerRegistered, "RPCGetCVEByID")
+	sp.RegisterHandler("RPCBatchGetCVE", createBatchGetCVEHandler(db, logger))
+	logger.Info(LogMsgRPCHandlerRegistered, "RPCBatchGetCVE")
 	sp.RegisterHandler("RPCDeleteCVEByID", createDeleteCVEByIDHandler(db, logger))
 	logger.Info(LogMsgRPCHandlerRegistered, "RPCDeleteCVEByID")
 	sp.RegisterHandler("RPCListCVEs", createListCVEsHandler(db, logger))
@@ -311,6 +311,12 @@ func main() {
 	sp.RegisterHandler("RPCCountCVEs", createCountCVEsHandler(rpcClient, logger))
 	logger.Info(LogMsgRPCHandlerRegistered, "RPCCountCVEs")
 	logger.Debug(LogMsgRPCClientHandlerRegistered, "RPCCountCVEs")
+	sp.RegisterHandler("RPCBatchPipeline", createBatchPipelineHandler(rpcClient, logger))
+	logger.Info(LogMsgRPCHandlerRegistered, "RPCBatchPipeline")
+	logger.Debug(LogMsgRPCClientHandlerRegistered, "RPCBatchPipeline")
+	sp.RegisterHandler("RPCBatchFetchCVEs", createBatchFetchCVEsHandler(rpcClient, logger))
+	logger.Info(LogMsgRPCHandlerRegistered, "RPCBatchFetchCVEs")
+	logger.Debug(LogMsgRPCClientHandlerRegistered, "RPCBatchFetchCVEs")
 
 	// Register job control RPC handlers
 	sp.RegisterHandler("RPCStartSession", createStartSessionHandler(jobExecutor, logger))
@@ -963,80 +969,67 @@ func createStopCWEViewJobHandler(controller *cwejob.Controller, logger *common.L
 	}
 }
 
-// createCreateCVEHandler creates a handler that creates a new CVE
-func createCreateCVEHandler(rpcClient *rpc.Client, logger *common.Logger) subprocess.Handler {
+// createFetchStoreCVEHandler builds the shared handler body for
+// RPCCreateCVE and RPCUpdateCVE: both take {cve_id}, fetch the record
+// from the remote service and hand it to the given local method — create
+// stores a new record, update refetches and overwrites the stored one.
+// This is the contract service.md documents; the handlers previously
+// expected a full CVE object and never touched remote.
+func createFetchStoreCVEHandler(rpcClient *rpc.Client, logger *common.Logger, rpcName, localMethod, verb string) subprocess.Handler {
 	return func(ctx context.Context, msg *subprocess.Message) (*subprocess.Message, error) {
-		logger.Debug(LogMsgRPCHandlerCalled, "RPCCreateCVE")
+		logger.Debug(LogMsgRPCHandlerCalled, rpcName)
 		logger.Debug(LogMsgRPCRequestReceived, msg.Type, msg.ID, msg.Source, msg.CorrelationID)
 
 		// Parse the request payload
-		var req cve.CVEItem
+		var req struct {
+			CVEID string `json:"cve_id"`
+		}
 		if err := subprocess.UnmarshalPayload(msg, &req); err != nil {
 			logger.Warn("Failed to parse request: %v", err)
 			return subprocess.NewErrorResponseWithPrefix(msg, "meta", fmt.Sprintf("failed to parse request: %v", err)), nil
 		}
-
-		// Create the CVE
-		// Validate required fields before making RPC calls
-		if req.ID == "" {
+		if req.CVEID == "" {
 			logger.Error("cve_id is required but was empty or missing")
 			return subprocess.NewErrorResponseWithPrefix(msg, "meta", "cve_id is required"), nil
 		}
-		resp, err := rpcClient.InvokeRPC(ctx, "local", "RPCCreateCVE", &req)
+
+		// Fetch the authoritative record from remote
+		item, err := fetchRemoteCVE(ctx, rpcClient, req.CVEID)
 		if err != nil {
-			logger.Warn("Failed to create CVE: %v", err)
-			return subprocess.NewErrorResponseWithPrefix(msg, "meta", fmt.Sprintf("failed to create CVE: %v", err)), nil
+			logger.Warn("Failed to fetch CVE %s: %v", req.CVEID, err)
+			return subprocess.NewErrorResponseWithPrefix(msg, "meta", fmt.Sprintf("failed to %s CVE: %v", verb, err)), nil
 		}
 
-		// Check if the response is an error
+		// Store it through local
+		resp, err := rpcClient.InvokeRPC(ctx, "local", localMethod, item)
+		if err != nil {
+			logger.Warn("Failed to %s CVE: %v", verb, err)
+			return subprocess.NewErrorResponseWithPrefix(msg, "meta", fmt.Sprintf("failed to %s CVE: %v", verb, err)), nil
+		}
 		if isErr, errMsg := subprocess.IsErrorResponse(resp); isErr {
-			logger.Warn("Error creating CVE: %s", errMsg)
-			return subprocess.NewErrorResponseWithPrefix(msg, "meta", fmt.Sprintf("failed to create CVE: %s", errMsg)), nil
+			logger.Warn("Error on %s CVE: %s", verb, errMsg)
+			return subprocess.NewErrorResponseWithPrefix(msg, "meta", fmt.Sprintf("failed to %s CVE: %s", verb, errMsg)), nil
 		}
 
-		logger.Info("RPCCreateCVE: Successfully created CVE")
+		logger.Info("%s: Successfully %sd CVE %s", rpcName, verb, req.CVEID)
 		return subprocess.NewSuccessResponse(msg, map[string]interface{}{
 			"success": true,
+			"cve_id":  req.CVEID,
+			"cve":     item,
 		})
 	}
 }
 
-// createUpdateCVEHandler creates a handler that updates an existing CVE
-func createUpdateCVEHandler(rpcClient *rpc.Client, logger *common.Logger) subprocess.Handler {
-	return func(ctx context.Context, msg *subprocess.Message) (*subprocess.Message, error) {
-		logger.Debug(LogMsgRPCHandlerCalled, "RPCUpdateCVE")
-		logger.Debug(LogMsgRPCRequestReceived, msg.Type, msg.ID, msg.Source, msg.CorrelationID)
-
-		// Parse the request payload
-		var req cve.CVEItem
-		if err := subprocess.UnmarshalPayload(msg, &req); err != nil {
-			logger.Warn("Failed to parse request: %v", err)
-			return subprocess.NewErrorResponseWithPrefix(msg, "meta", fmt.Sprintf("failed to parse request: %v", err)), nil
-		}
-
-		// Update the CVE
-		// Validate required fields before making RPC calls
-		if req.ID == "" {
-			logger.Error("cve_id is required but was empty or missing")
-			return subprocess.NewErrorResponseWithPrefix(msg, "meta", "cve_id is required"), nil
-		}
-		resp, err := rpcClient.InvokeRPC(ctx, "local", "RPCUpdateCVE", &req)
-		if err != nil {
-			logger.Warn("Failed to update CVE: %v", err)
-			return subprocess.NewErrorResponseWithPrefix(msg, "meta", fmt.Sprintf("failed to update CVE: %v", err)), nil
-		}
-
-		// Check if the response is an error
-		if isErr, errMsg := subprocess.IsErrorResponse(resp); isErr {
-			logger.Warn("Error updating CVE: %s", errMsg)
-			return subprocess.NewErrorResponseWithPrefix(msg, "meta", fmt.Sprintf("failed to update CVE: %s", errMsg)), nil
-		}
+// createCreateCVEHandler creates a handler that creates a new CVE in
+// local storage by fetching it from remote
+func createCreateCVEHandler(rpcClient *rpc.Client, logger *common.Logger) subprocess.Handler {
+	return createFetchStoreCVEHandler(rpcClient, logger, "RPCCreateCVE", "RPCCreateCVE", "create")
+}
 
-		logger.Info("RPCUpdateCVE: Successfully updated CVE")
-		return subprocess.NewSuccessResponse(msg, map[string]interface{}{
-			"success": true,
-		})
-	}
+// createUpdateCVEHandler creates a handler that updates a stored CVE by
+// refetching it from remote
+func createUpdateCVEHandler(rpcClient *rpc.Client, logger *common.Logger) subprocess.Handler {
+	return createFetchStoreCVEHandler(rpcClient, logger, "RPCUpdateCVE", "RPCUpdateCVE", "update")
 }
 
 // createDeleteCVEHandler creates a handler that deletes an existing CVE
@@ -1074,7 +1067,8 @@ func createDeleteCVEHandler(rpcClient *rpc.Client, logger *common.Logger) subpro
 
 		logger.Info("RPCDeleteCVE: Successfully deleted CVE")
 		return subprocess.NewSuccessResponse(msg, map[string]interface{}{
-			"success": true,
+			"success":      true,
+			"stored_after": false,
 		})
 	}
 }
@@ -1089,20 +1083,39 @@ func createListCVEsHandler(rpcClient *rpc.Client, logger *common.Logger) subproc
 		var req struct {
 			Offset int `json:"offset"`
 			Limit  int `json:"limit"`
+			Pages  []struct {
+				Offset int `json:"offset"`
+				Limit  int `json:"limit"`
+			} `json:"pages"`
 		}
 		if err := subprocess.UnmarshalPayload(msg, &req); err != nil {
 			logger.Warn("Failed to parse request: %v", err)
 			return subprocess.NewErrorResponseWithPrefix(msg, "meta", fmt.Sprintf("failed to parse request: %v", err)), nil
 		}
 
-		if req.Offset < 0 {
-			logger.Error("offset must be non-negative")
-			return subprocess.NewErrorResponseWithPrefix(msg, "meta", "offset must be non-negative"), nil
-		}
+		if len(req.Pages) > 0 {
+			// Batched form: several (offset, limit) windows answered in one
+			// round trip by the local service
+			for _, page := range req.Pages {
+				if page.Offset < 0 {
+					logger.Error("offset must be non-negative")
+					return subprocess.NewErrorResponseWithPrefix(msg, "meta", "offset must be non-negative"), nil
+				}
+				if page.Limit <= 0 {
+					logger.Error("limit must be positive")
+					return subprocess.NewErrorResponseWithPrefix(msg, "meta", "limit must be positive"), nil
+				}
+			}
+		} else {
+			if req.Offset < 0 {
+				logger.Error("offset must be non-negative")
+				return subprocess.NewErrorResponseWithPrefix(msg, "meta", "offset must be non-negative"), nil
+			}
 
-		if req.Limit <= 0 {
-			logger.Error("limit must be positive")
-			return subprocess.NewErrorResponseWithPrefix(msg, "meta", "limit must be positive"), nil
+			if req.Limit <= 0 {
+				logger.Error("limit must be positive")
+				return subprocess.NewErrorResponseWithPrefix(msg, "meta", "limit must be positive"), nil
+			}
 		}
 
 		// List CVEs
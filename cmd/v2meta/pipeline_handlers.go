@@ -0,0 +1,251 @@
+// Package main provides the batched RPC handlers for the meta service.
+package main
+
+import (
+	"context"
+	"fmt"
+	"strconv"
+	"strings"
+
+	"github.com/cyw0ng95/v2e/pkg/common"
+	"github.com/cyw0ng95/v2e/pkg/cve"
+	"github.com/cyw0ng95/v2e/pkg/proc/subprocess"
+	"github.com/cyw0ng95/v2e/pkg/rpc"
+)
+
+// pipelineStep describes one RPC call inside a batched pipeline. A step
+// may consume the payload of an earlier step: InputFrom names the index
+// of the producing step, OutputKey selects a field of that payload (dot
+// path, numeric segments index into arrays; empty means the whole
+// payload), and InputKey names the parameter the value is injected
+// under. With InputFrom unset (or negative) the step runs standalone.
+type pipelineStep struct {
+	Method    string                 `json:"method"`
+	Target    string                 `json:"target"`
+	Params    map[string]interface{} `json:"params"`
+	InputFrom *int                   `json:"input_from"`
+	InputKey  string                 `json:"input_key"`
+	OutputKey string                 `json:"output_key"`
+}
+
+// pipelineStepResult is one element of the RPCBatchPipeline response,
+// index-aligned with the request steps.
+type pipelineStepResult struct {
+	Method  string      `json:"method"`
+	Target  string      `json:"target"`
+	Payload interface{} `json:"payload,omitempty"`
+	Error   string      `json:"error,omitempty"`
+}
+
+// extractField walks a dot-separated path through decoded JSON; numeric
+// segments index into arrays (e.g. "vulnerabilities.0.cve").
+func extractField(value interface{}, path string) (interface{}, error) {
+	if path == "" {
+		return value, nil
+	}
+	for _, segment := range strings.Split(path, ".") {
+		switch v := value.(type) {
+		case map[string]interface{}:
+			inner, ok := v[segment]
+			if !ok {
+				return nil, fmt.Errorf("field %q not found", segment)
+			}
+			value = inner
+		case []interface{}:
+			idx, err := strconv.Atoi(segment)
+			if err != nil || idx < 0 || idx >= len(v) {
+				return nil, fmt.Errorf("invalid array index %q", segment)
+			}
+			value = v[idx]
+		default:
+			return nil, fmt.Errorf("cannot descend into %T at %q", value, segment)
+		}
+	}
+	return value, nil
+}
+
+// batchFetchResult is one element of the RPCBatchFetchCVEs response,
+// index-aligned with the requested ids.
+type batchFetchResult struct {
+	CVEID         string `json:"cve_id"`
+	AlreadyStored bool   `json:"already_stored"`
+	Error         string `json:"error,omitempty"`
+}
+
+// fetchRemoteCVE fetches one CVE from the remote service and returns the
+// parsed item. A well-formed NVD answer with no vulnerabilities is
+// reported as "not found" so gateway error-code mapping stays stable.
+func fetchRemoteCVE(ctx context.Context, rpcClient *rpc.Client, cveID string) (*cve.CVEItem, error) {
+	remoteResp, err := rpcClient.InvokeRPC(ctx, "remote", "RPCGetCVEByID", &rpc.CVEIDParams{CVEID: cveID})
+	if err != nil {
+		return nil, fmt.Errorf("failed to fetch from remote: %v", err)
+	}
+	if isErr, errMsg := subprocess.IsErrorResponse(remoteResp); isErr {
+		return nil, fmt.Errorf("%s", errMsg)
+	}
+	var remoteResult cve.CVEResponse
+	if err := subprocess.UnmarshalPayload(remoteResp, &remoteResult); err != nil {
+		return nil, fmt.Errorf("failed to parse remote response: %v", err)
+	}
+	if len(remoteResult.Vulnerabilities) == 0 {
+		return nil, fmt.Errorf("CVE %s not found", cveID)
+	}
+	return &remoteResult.Vulnerabilities[0].CVE, nil
+}
+
+// fetchAndStoreCVE runs the stored-check → remote fetch → local save
+// sequence for one id and reports whether local storage already held it.
+func fetchAndStoreCVE(ctx context.Context, rpcClient *rpc.Client, cveID string) batchFetchResult {
+	result := batchFetchResult{CVEID: cveID}
+
+	checkResp, err := rpcClient.InvokeRPC(ctx, "local", "RPCIsCVEStoredByID", &rpc.CVEIDParams{CVEID: cveID})
+	if err != nil {
+		result.Error = fmt.Sprintf("failed to check local storage: %v", err)
+		return result
+	}
+	var checkResult struct {
+		Stored bool `json:"stored"`
+	}
+	if err := subprocess.UnmarshalPayload(checkResp, &checkResult); err != nil {
+		result.Error = fmt.Sprintf("failed to parse check response: %v", err)
+		return result
+	}
+	if checkResult.Stored {
+		result.AlreadyStored = true
+		return result
+	}
+
+	item, err := fetchRemoteCVE(ctx, rpcClient, cveID)
+	if err != nil {
+		result.Error = err.Error()
+		return result
+	}
+
+	saveResp, err := rpcClient.InvokeRPC(ctx, "local", "RPCSaveCVEByID", &rpc.SaveCVEByIDParams{CVE: *item})
+	if err != nil {
+		result.Error = fmt.Sprintf("failed to save to local storage: %v", err)
+		return result
+	}
+	if isErr, errMsg := subprocess.IsErrorResponse(saveResp); isErr {
+		result.Error = fmt.Sprintf("failed to save to local storage: %s", errMsg)
+		return result
+	}
+	return result
+}
+
+// createBatchFetchCVEsHandler creates a handler for RPCBatchFetchCVEs.
+// N fetch-and-store calls issued one by one pay a client round trip per
+// id; this accepts the whole id list in one request and runs the
+// stored-check/fetch/save sequence per id on internal broker hops. Ids
+// are processed in order, so a duplicate later in the list observes the
+// earlier occurrence as already stored. Per-id failures are recorded in
+// the result array and do not abort the batch.
+func createBatchFetchCVEsHandler(rpcClient *rpc.Client, logger *common.Logger) subprocess.Handler {
+	return func(ctx context.Context, msg *subprocess.Message) (*subprocess.Message, error) {
+		logger.Debug(LogMsgRPCHandlerCalled, "RPCBatchFetchCVEs")
+
+		var req struct {
+			CVEIDs []string `json:"cve_ids"`
+		}
+		if errResp := subprocess.ParseRequest(msg, &req); errResp != nil {
+			return errResp, nil
+		}
+		if len(req.CVEIDs) == 0 {
+			return subprocess.NewErrorResponseWithPrefix(msg, "meta", "cve_ids is required"), nil
+		}
+
+		results := make([]batchFetchResult, len(req.CVEIDs))
+		for i, cveID := range req.CVEIDs {
+			logger.Info("RPCBatchFetchCVEs: processing %s (%d/%d)", cveID, i+1, len(req.CVEIDs))
+			results[i] = fetchAndStoreCVE(ctx, rpcClient, cveID)
+		}
+
+		return subprocess.NewSuccessResponse(msg, map[string]interface{}{
+			"results": results,
+			"count":   len(results),
+		})
+	}
+}
+
+// createBatchPipelineHandler creates a handler for RPCBatchPipeline. The
+// meta service already sits between remote and local, so dependent call
+// chains like fetch-from-remote → save-to-local → check-stored can run
+// here on internal broker hops instead of paying one client round trip
+// per call. Steps execute in request order; a failing step records its
+// error and aborts the remainder (later steps may depend on its output),
+// and the response array stays index-aligned with the request.
+func createBatchPipelineHandler(rpcClient *rpc.Client, logger *common.Logger) subprocess.Handler {
+	return func(ctx context.Context, msg *subprocess.Message) (*subprocess.Message, error) {
+		logger.Debug(LogMsgRPCHandlerCalled, "RPCBatchPipeline")
+
+		var req struct {
+			Steps []pipelineStep `json:"steps"`
+		}
+		if errResp := subprocess.ParseRequest(msg, &req); errResp != nil {
+			return errResp, nil
+		}
+		if len(req.Steps) == 0 {
+			return subprocess.NewErrorResponseWithPrefix(msg, "meta", "steps is required"), nil
+		}
+
+		results := make([]pipelineStepResult, len(req.Steps))
+		payloads := make([]interface{}, len(req.Steps))
+
+		for i, step := range req.Steps {
+			results[i] = pipelineStepResult{Method: step.Method, Target: step.Target}
+
+			if step.Method == "" || step.Target == "" {
+				results[i].Error = "method and target are required"
+				break
+			}
+
+			params := step.Params
+			if step.InputFrom != nil && *step.InputFrom >= 0 {
+				from := *step.InputFrom
+				if from >= i {
+					results[i].Error = fmt.Sprintf("input_from %d must reference an earlier step", from)
+					break
+				}
+				if step.InputKey == "" {
+					results[i].Error = "input_key is required when input_from is set"
+					break
+				}
+				value, err := extractField(payloads[from], step.OutputKey)
+				if err != nil {
+					results[i].Error = fmt.Sprintf("failed to extract %q from step %d: %v", step.OutputKey, from, err)
+					break
+				}
+				if params == nil {
+					params = make(map[string]interface{}, 1)
+				}
+				params[step.InputKey] = value
+			}
+
+			logger.Info("RPCBatchPipeline: step %d calling %s on %s", i, step.Method, step.Target)
+			resp, err := rpcClient.InvokeRPC(ctx, step.Target, step.Method, params)
+			if err != nil {
+				results[i].Error = fmt.Sprintf("RPC error: %v", err)
+				break
+			}
+			if isErr, errMsg := subprocess.IsErrorResponse(resp); isErr {
+				results[i].Error = errMsg
+				break
+			}
+
+			var payload interface{}
+			if resp.Payload != nil {
+				if err := subprocess.UnmarshalFast(resp.Payload, &payload); err != nil {
+					results[i].Error = fmt.Sprintf("failed to parse response: %v", err)
+					break
+				}
+			}
+			payloads[i] = payload
+			results[i].Payload = payload
+		}
+
+		logger.Debug("RPCBatchPipeline: completed %d steps", len(req.Steps))
+		return subprocess.NewSuccessResponse(msg, map[string]interface{}{
+			"steps": results,
+		})
+	}
+}
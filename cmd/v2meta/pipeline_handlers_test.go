@@ -0,0 +1,52 @@
+package main
+
+import (
+	"testing"
+)
+
+func TestExtractField(t *testing.T) {
+	payload := map[string]interface{}{
+		"total": float64(1),
+		"vulnerabilities": []interface{}{
+			map[string]interface{}{
+				"cve": map[string]interface{}{"id": "CVE-2021-44228"},
+			},
+		},
+	}
+
+	tests := []struct {
+		name    string
+		path    string
+		want    interface{}
+		wantErr bool
+	}{
+		{"empty path returns whole payload", "", nil, false},
+		{"top-level field", "total", float64(1), false},
+		{"array index then field", "vulnerabilities.0.cve.id", "CVE-2021-44228", false},
+		{"missing field", "nonexistent", nil, true},
+		{"index out of range", "vulnerabilities.5", nil, true},
+		{"non-numeric array index", "vulnerabilities.first", nil, true},
+		{"descend into scalar", "total.deeper", nil, true},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			got, err := extractField(payload, tt.path)
+			if (err != nil) != tt.wantErr {
+				t.Fatalf("extractField(%q) error = %v, wantErr %v", tt.path, err, tt.wantErr)
+			}
+			if tt.wantErr {
+				return
+			}
+			if tt.path == "" {
+				if _, ok := got.(map[string]interface{}); !ok {
+					t.Fatalf("expected whole payload back, got %T", got)
+				}
+				return
+			}
+			if got != tt.want {
+				t.Errorf("extractField(%q) = %v, want %v", tt.path, got, tt.want)
+			}
+		})
+	}
+}
@@ -11,6 +11,7 @@ import (
 	"archive/zip"
 	"bytes"
 	"context"
+	"encoding/json"
 	"fmt"
 	"io"
 	"net/http"
@@ -44,9 +45,12 @@ func main() {
 	fetcher := remote.NewFetcher(apiKey)
 	logger.Info(LogMsgFetcherCreated, apiKey != "")
 
+	// On-disk cache for fetch-by-id responses (see nvd_cache.go)
+	cache := newNVDCache()
+
 	// Register RPC handlers
 	logger.Info("Registering RPC handlers...")
-	sp.RegisterHandler("RPCGetCVEByID", createGetCVEByIDHandler(fetcher))
+	sp.RegisterHandler("RPCGetCVEByID", createGetCVEByIDHandler(fetcher, cache))
 	logger.Info(LogMsgRPCHandlerRegistered, "RPCGetCVEByID")
 	sp.RegisterHandler("RPCGetCVECnt", createGetCVECntHandler(fetcher))
 	logger.Info(LogMsgRPCHandlerRegistered, "RPCGetCVECnt")
@@ -179,7 +183,7 @@ func createFetchViewsHandler() subprocess.Handler {
 }
 
 // createGetCVEByIDHandler creates a handler for RPCGetCVEByID
-func createGetCVEByIDHandler(fetcher *remote.Fetcher) subprocess.Handler {
+func createGetCVEByIDHandler(fetcher *remote.Fetcher, cache *nvdCache) subprocess.Handler {
 	return func(ctx context.Context, msg *subprocess.Message) (*subprocess.Message, error) {
 		// Parse the request payload
 		var req struct {
@@ -194,6 +198,12 @@ func createGetCVEByIDHandler(fetcher *remote.Fetcher) subprocess.Handler {
 			return errMsg, nil
 		}
 
+		// Serve repeats from the on-disk cache: the payload is stored as
+		// the marshaled response, so a hit skips NVD and re-marshaling
+		if data := cache.get(req.CVEID); data != nil {
+			return subprocess.NewSuccessResponse(msg, json.RawMessage(data))
+		}
+
 		// Fetch CVE from NVD
 		response, err := fetcher.FetchCVEByID(req.CVEID)
 		if err != nil {
@@ -204,6 +214,10 @@ func createGetCVEByIDHandler(fetcher *remote.Fetcher) subprocess.Handler {
 			return subprocess.NewErrorResponse(msg, fmt.Sprintf(ErrMsgFailedFetchCVE, err)), nil
 		}
 
+		if data, err := subprocess.MarshalFast(response); err == nil {
+			cache.put(req.CVEID, data)
+		}
+
 		return subprocess.NewSuccessResponse(msg, response)
 	}
 }
@@ -0,0 +1,97 @@
+package main
+
+import (
+	"os"
+	"path/filepath"
+	"time"
+)
+
+// nvdCache is a filesystem cache for NVD fetch-by-id responses. Test
+// suites and re-imports request the same well-known CVE ids over and
+// over; serving repeats from disk trades a ~300ms HTTPS round trip (and
+// a slice of NVD's tight rate-limit budget) for a file read. Entries
+// expire by mtime so stale records are re-fetched after the TTL.
+//
+// The directory defaults to <tmp>/nvd-cache and can be moved via the
+// NVD_CACHE_DIR environment variable; setting it to "off" disables
+// caching entirely.
+type nvdCache struct {
+	dir string
+	ttl time.Duration
+}
+
+// newNVDCache builds the cache from the environment; returns nil (all
+// methods are nil-safe) when caching is disabled.
+func newNVDCache() *nvdCache {
+	dir := os.Getenv("NVD_CACHE_DIR")
+	if dir == "off" {
+		return nil
+	}
+	if dir == "" {
+		dir = filepath.Join(os.TempDir(), "nvd-cache")
+	}
+	return &nvdCache{dir: dir, ttl: 24 * time.Hour}
+}
+
+// validCacheID reports whether the CVE id is safe to use as a file name.
+func validCacheID(cveID string) bool {
+	for _, r := range cveID {
+		switch {
+		case r >= 'A' && r <= 'Z', r >= 'a' && r <= 'z', r >= '0' && r <= '9', r == '-':
+		default:
+			return false
+		}
+	}
+	return cveID != ""
+}
+
+func (c *nvdCache) path(cveID string) string {
+	return filepath.Join(c.dir, cveID+".json")
+}
+
+// get returns the cached response payload for cveID, or nil on a miss,
+// an expired entry, or any read error (misses are never fatal).
+func (c *nvdCache) get(cveID string) []byte {
+	if c == nil || !validCacheID(cveID) {
+		return nil
+	}
+	path := c.path(cveID)
+	info, err := os.Stat(path)
+	if err != nil || time.Since(info.ModTime()) > c.ttl {
+		return nil
+	}
+	data, err := os.ReadFile(path)
+	if err != nil || len(data) == 0 {
+		return nil
+	}
+	return data
+}
+
+// put stores the response payload for cveID with a write-to-temp-then-
+// rename so concurrent readers never observe a partial file. Failures
+// are ignored: the cache is an optimization, not a source of truth.
+func (c *nvdCache) put(cveID string, data []byte) {
+	if c == nil || !validCacheID(cveID) || len(data) == 0 {
+		return
+	}
+	if err := os.MkdirAll(c.dir, 0o755); err != nil {
+		return
+	}
+	path := c.path(cveID)
+	tmp, err := os.CreateTemp(c.dir, cveID+".*.tmp")
+	if err != nil {
+		return
+	}
+	if _, err := tmp.Write(data); err != nil {
+		tmp.Close()
+		os.Remove(tmp.Name())
+		return
+	}
+	if err := tmp.Close(); err != nil {
+		os.Remove(tmp.Name())
+		return
+	}
+	if err := os.Rename(tmp.Name(), path); err != nil {
+		os.Remove(tmp.Name())
+	}
+}
@@ -0,0 +1,94 @@
+package main
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+)
+
+func TestValidCacheID(t *testing.T) {
+	tests := []struct {
+		name  string
+		cveID string
+		want  bool
+	}{
+		{"typical id", "CVE-2021-44228", true},
+		{"lowercase", "cve-2021-44228", true},
+		{"empty", "", false},
+		{"path traversal", "../etc/passwd", false},
+		{"separator", "CVE/2021", false},
+		{"whitespace", "CVE 2021", false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := validCacheID(tt.cveID); got != tt.want {
+				t.Errorf("validCacheID(%q) = %v, want %v", tt.cveID, got, tt.want)
+			}
+		})
+	}
+}
+
+func TestNVDCachePutGet(t *testing.T) {
+	cache := &nvdCache{dir: t.TempDir(), ttl: time.Hour}
+	payload := []byte(`{"vulnerabilities":[{"cve":{"id":"CVE-2021-44228"}}]}`)
+
+	if got := cache.get("CVE-2021-44228"); got != nil {
+		t.Fatalf("expected miss on empty cache, got %q", got)
+	}
+
+	cache.put("CVE-2021-44228", payload)
+	got := cache.get("CVE-2021-44228")
+	if string(got) != string(payload) {
+		t.Fatalf("round trip mismatch: got %q, want %q", got, payload)
+	}
+
+	// No partial files may be left behind by the atomic write
+	entries, err := os.ReadDir(cache.dir)
+	if err != nil {
+		t.Fatal(err)
+	}
+	if len(entries) != 1 {
+		t.Fatalf("expected exactly one cache file, found %d", len(entries))
+	}
+}
+
+func TestNVDCacheExpiry(t *testing.T) {
+	cache := &nvdCache{dir: t.TempDir(), ttl: time.Hour}
+	cache.put("CVE-2021-44228", []byte(`{}`))
+
+	// Age the entry past the TTL via mtime instead of sleeping
+	stale := time.Now().Add(-2 * time.Hour)
+	if err := os.Chtimes(cache.path("CVE-2021-44228"), stale, stale); err != nil {
+		t.Fatal(err)
+	}
+
+	if got := cache.get("CVE-2021-44228"); got != nil {
+		t.Fatalf("expected expired entry to miss, got %q", got)
+	}
+}
+
+func TestNVDCacheDisabled(t *testing.T) {
+	var cache *nvdCache
+
+	// All methods must be nil-safe so callers need no disabled checks
+	cache.put("CVE-2021-44228", []byte(`{}`))
+	if got := cache.get("CVE-2021-44228"); got != nil {
+		t.Fatalf("nil cache returned data: %q", got)
+	}
+}
+
+func TestNewNVDCacheEnv(t *testing.T) {
+	t.Setenv("NVD_CACHE_DIR", "off")
+	if cache := newNVDCache(); cache != nil {
+		t.Fatal("expected nil cache when NVD_CACHE_DIR=off")
+	}
+
+	dir := filepath.Join(t.TempDir(), "custom")
+	t.Setenv("NVD_CACHE_DIR", dir)
+	cache := newNVDCache()
+	if cache == nil || cache.dir != dir {
+		t.Fatalf("expected cache rooted at %q, got %+v", dir, cache)
+	}
+}
@@ -0,0 +1,68 @@
+package local
+
+import (
+	"bytes"
+	"compress/gzip"
+	"io"
+	"strings"
+)
+
+// CVE JSON documents are highly repetitive (field names, CPE URIs,
+// reference URLs) and typically shrink 5-10x under DEFLATE, so the full
+// payload in CVERecord.Data is stored gzip-compressed. Compression is
+// transparent: writers go through encodeCVEData, readers through
+// decodeCVEData, and rows written before this change (plain JSON) are
+// recognized by the absence of the gzip magic bytes and returned as-is,
+// so no migration is required.
+
+// compressThreshold skips compression for payloads too small to benefit;
+// the gzip header alone is 18 bytes and tiny records stay byte-for-byte
+// inspectable in the database.
+const compressThreshold = 256
+
+// compressionLevel trades a slightly worse ratio for much cheaper
+// writes; bulk imports are write-heavy and level 3 keeps most of the
+// size win at a fraction of the CPU cost of the default level.
+const compressionLevel = 3
+
+// encodeCVEData returns the storage form of a marshaled CVE payload:
+// gzip-compressed when that actually shrinks it, plain JSON otherwise.
+// Compression failures fall back to the uncompressed form — the column
+// must always hold a decodable payload.
+func encodeCVEData(data []byte) string {
+	if len(data) < compressThreshold {
+		return string(data)
+	}
+	var buf bytes.Buffer
+	w, err := gzip.NewWriterLevel(&buf, compressionLevel)
+	if err != nil {
+		return string(data)
+	}
+	if _, err := w.Write(data); err != nil {
+		w.Close()
+		return string(data)
+	}
+	if err := w.Close(); err != nil {
+		return string(data)
+	}
+	if buf.Len() >= len(data) {
+		// Incompressible payload; store plain so decode stays cheap
+		return string(data)
+	}
+	return buf.String()
+}
+
+// decodeCVEData returns the original JSON bytes for a stored Data value,
+// decompressing when the value carries the gzip magic prefix and passing
+// legacy plain-JSON rows through unchanged.
+func decodeCVEData(stored string) ([]byte, error) {
+	if len(stored) < 2 || stored[0] != 0x1f || stored[1] != 0x8b {
+		return []byte(stored), nil
+	}
+	r, err := gzip.NewReader(strings.NewReader(stored))
+	if err != nil {
+		return nil, err
+	}
+	defer r.Close()
+	return io.ReadAll(r)
+}
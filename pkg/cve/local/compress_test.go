@@ -0,0 +1,87 @@
+package local
+
+import (
+	"strings"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestEncodeDecodeCVEData(t *testing.T) {
+	tests := []struct {
+		name             string
+		data             string
+		expectCompressed bool
+	}{
+		{
+			name:             "small payload stored plain",
+			data:             `{"id":"CVE-2021-44228"}`,
+			expectCompressed: false,
+		},
+		{
+			name: "repetitive payload compressed",
+			data: `{"id":"CVE-2021-44228","descriptions":[` +
+				strings.Repeat(`{"lang":"en","value":"Remote code execution in log4j"},`, 50) +
+				`{"lang":"en","value":"end"}]}`,
+			expectCompressed: true,
+		},
+		{
+			name:             "incompressible payload stored plain",
+			data:             randomishPayload(512),
+			expectCompressed: false,
+		},
+		{
+			name:             "empty payload",
+			data:             "",
+			expectCompressed: false,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			stored := encodeCVEData([]byte(tt.data))
+
+			compressed := len(stored) >= 2 && stored[0] == 0x1f && stored[1] == 0x8b
+			assert.Equal(t, tt.expectCompressed, compressed)
+			if tt.expectCompressed {
+				assert.Less(t, len(stored), len(tt.data))
+			}
+
+			decoded, err := decodeCVEData(stored)
+			require.NoError(t, err)
+			assert.Equal(t, tt.data, string(decoded))
+		})
+	}
+}
+
+func TestDecodeCVEData_LegacyPlainJSON(t *testing.T) {
+	// Rows written before compression hold plain JSON and must decode
+	// unchanged regardless of size
+	legacy := `{"id":"CVE-2020-0001","vulnStatus":"Analyzed"}`
+	decoded, err := decodeCVEData(legacy)
+	require.NoError(t, err)
+	assert.Equal(t, legacy, string(decoded))
+}
+
+func TestDecodeCVEData_CorruptGzip(t *testing.T) {
+	// A gzip magic prefix with a truncated stream must surface an error
+	// rather than silently returning garbage
+	_, err := decodeCVEData("\x1f\x8b\x00\x00")
+	assert.Error(t, err)
+}
+
+// randomishPayload builds a deterministic high-entropy string that gzip
+// cannot shrink, without pulling in math/rand.
+func randomishPayload(n int) string {
+	var b strings.Builder
+	b.Grow(n)
+	state := uint32(2463534242)
+	for i := 0; i < n; i++ {
+		state ^= state << 13
+		state ^= state >> 17
+		state ^= state << 5
+		b.WriteByte(byte(state))
+	}
+	return b.String()
+}
@@ -37,7 +37,7 @@ type CVERecord struct {
 	Published    time.Time `gorm:"index"`
 	LastModified time.Time `gorm:"index"`
 	VulnStatus   string    `gorm:"index"`
-	Data         string    `gorm:"type:text"` // JSON representation of full CVEItem
+	Data         string    `gorm:"type:text"` // Full CVEItem JSON, gzip-compressed (see compress.go)
 }
 
 // NewOptimizedDB creates an optimized database connection
@@ -164,7 +164,7 @@ func (d *DB) SaveCVE(cveItem *cve.CVEItem) error {
 		Published:    cveItem.Published.Time,
 		LastModified: cveItem.LastModified.Time,
 		VulnStatus:   cveItem.VulnStatus,
-		Data:         string(data),
+		Data:         encodeCVEData(data),
 	}
 
 	// Check if record exists
@@ -229,7 +229,7 @@ func (d *DB) SaveCVEs(cves []cve.CVEItem) error {
 			Published:    cves[i].Published.Time,
 			LastModified: cves[i].LastModified.Time,
 			VulnStatus:   cves[i].VulnStatus,
-			Data:         string(data),
+			Data:         encodeCVEData(data),
 		}
 	}
 
@@ -245,8 +245,13 @@ func (d *DB) GetCVE(cveID string) (*cve.CVEItem, error) {
 		return nil, err
 	}
 
+	data, err := decodeCVEData(record.Data)
+	if err != nil {
+		return nil, err
+	}
+
 	var cveItem cve.CVEItem
-	if err := jsonutil.Unmarshal([]byte(record.Data), &cveItem); err != nil {
+	if err := jsonutil.Unmarshal(data, &cveItem); err != nil {
 		return nil, err
 	}
 
@@ -276,7 +281,11 @@ func (d *DB) ListCVEs(offset, limit int) ([]cve.CVEItem, error) {
 	// Pre-allocate with exact capacity to avoid re-allocations
 	cves := make([]cve.CVEItem, len(records))
 	for i, record := range records {
-		if err := jsonutil.Unmarshal([]byte(record.Data), &cves[i]); err != nil {
+		data, err := decodeCVEData(record.Data)
+		if err != nil {
+			return nil, err
+		}
+		if err := jsonutil.Unmarshal(data, &cves[i]); err != nil {
 			return nil, err
 		}
 	}
@@ -337,7 +346,9 @@ func (l *LazyCVERecord) Load() error {
 	return nil
 }
 
-// GetCVERaw retrieves raw CVE record without unmarshaling the data field
+// GetCVERaw retrieves raw CVE record without unmarshaling the data field.
+// Note the Data field holds the storage form (possibly gzip-compressed);
+// callers that need the JSON bytes should go through GetCVE instead.
 func (d *DB) GetCVERaw(cveID string) (*CVERecord, error) {
 	var record CVERecord
 	if err := d.db.Where("cve_id = ?", cveID).First(&record).Error; err != nil {
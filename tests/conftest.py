@@ -0,0 +1,849 @@
+"""Shared fixtures for the v2e integration test suite.
+
+These tests exercise the full broker-first stack from the outside: the
+broker is started as a real subprocess, it spawns the service binaries
+(access, local, remote, meta, ...), and every assertion goes through the
+access service's REST gateway at /restful/rpc.
+
+Build the binaries first with ./build.sh -p so .build/package is populated.
+Tests that would reach NVD through the remote service are marked slow.
+"""
+
+import asyncio
+import concurrent.futures
+import contextlib
+import fcntl
+import functools
+import logging
+import os
+import queue
+import random
+import re
+import signal
+import subprocess
+import sys
+import threading
+import time
+import uuid
+
+import pytest
+import requests
+
+from helpers import ensure_cve, wait_until
+
+# Large NVD-backed payloads (tens of KB per CVE) make stdlib json.loads the
+# dominant client-side cost; orjson parses them several times faster. Fall
+# back to stdlib when orjson is not installed.
+try:
+    import orjson
+
+    def _decode_json(buf):
+        return orjson.loads(buf)
+
+    def _encode_json(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    import json
+
+    def _decode_json(buf):
+        return json.loads(buf)
+
+    def _encode_json(obj):
+        return json.dumps(obj).encode()
+
+# Streaming parser for id-only list reads; optional like orjson.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Directory produced by ./build.sh -p; the broker detects sibling binaries.
+PACKAGE_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", ".build", "package")
+)
+
+ACCESS_BASE_URL = os.environ.get("V2E_ACCESS_URL", "http://127.0.0.1:8080")
+
+
+# Cache-dependency order for the CRUD classes: classes that populate the
+# store (create) run before the classes that read, mutate or enumerate it,
+# so downstream tests need no "ensure the CVE exists" create preambles.
+# Unlisted classes keep their collection order after the ranked ones.
+_CLASS_ORDER = {
+    "TestCVENegativePaths": 0,
+    "TestCVECreateOperation": 1,
+    "TestCVEReadOperation": 2,
+    "TestCVEUpdateOperation": 3,
+    "TestCVEDeleteOperation": 4,
+    "TestCVEListOperation": 5,
+    "TestCVEBusinessFlows": 6,
+}
+
+
+def pytest_collection_modifyitems(config, items):
+    # Sort per module (first-seen module rank keeps files contiguous for
+    # --dist=loadfile) and by class rank within it; the sort is stable, so
+    # in-class order — and the dependency chains — are untouched.
+    module_rank = {}
+    for item in items:
+        module_rank.setdefault(item.module.__name__, len(module_rank))
+    items.sort(key=lambda item: (
+        module_rank[item.module.__name__],
+        _CLASS_ORDER.get(item.cls.__name__ if item.cls else "", 99),
+    ))
+
+
+def pytest_configure(config):
+    # Step diagnostics in the test modules go through logging; quiet runs
+    # keep those loggers at WARNING so nothing is formatted or written,
+    # while -v raises them to DEBUG for pytest's log capture to show.
+    level = logging.DEBUG if config.getoption("verbose") else logging.WARNING
+    for name in (
+        "test_cve_crud",
+        "test_web_workflows",
+        "test_cve_meta_integration",
+        "test_edge_cases",
+    ):
+        logging.getLogger(name).setLevel(level)
+
+# Pre-encoded bodies bypass requests' json= kwarg (stdlib json.dumps), so
+# the Content-Type must be set by hand
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+# Legacy-message fallback; new access builds set the stable error_code field
+_RL_RE = re.compile(r"NVD_RATE_LIMITED|\b429\b")
+
+
+def is_rate_limited(response):
+    """Return True when a response indicates NVD throttled the request.
+
+    rpc_call classifies every response once at the wire and records the
+    verdict under "_rate_limited", so the common path here is one dict
+    lookup; the field checks below only run for responses that did not
+    come through the client (e.g. fixtures built by hand).
+    """
+    flag = response.get("_rate_limited")
+    if flag is not None:
+        return flag
+    if response.get("error_code") == "NVD_RATE_LIMITED":
+        return True
+    if response.get("retcode") == 0:
+        return False
+    return bool(_RL_RE.search(response.get("message") or ""))
+
+
+class NVDRateLimited(Exception):
+    """Raised when an RPC response indicates NVD throttled the request."""
+
+
+def raise_if_rate_limited(response):
+    """Raise NVDRateLimited for throttled responses; pass others through."""
+    if is_rate_limited(response):
+        raise NVDRateLimited(response.get("message", ""))
+    return response
+
+
+def with_nvd_retries(total=3):
+    """Retry a test body on NVD throttling instead of skipping outright.
+
+    A skip still pays collection, fixture setup and the probe RPC, then
+    forces a whole-suite rerun to get coverage. Retrying in place with
+    exponential backoff plus jitter keeps fixtures warm and usually lets
+    the test complete once the 30s rolling window clears; only after the
+    budget is exhausted does it fall back to pytest.skip.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            for attempt in range(total):
+                try:
+                    return fn(*args, **kwargs)
+                except NVDRateLimited:
+                    time.sleep(2 ** attempt + random.random())
+            pytest.skip(f"NVD rate limited after {total} retries")
+        return wrapper
+    return decorator
+
+
+def assert_ok(response):
+    """Assert the standard success envelope in one place.
+
+    Every success path checks the same three fields; centralizing the
+    checks keeps the tests down to one call per response and gives a single
+    seam for schema validation later.
+    """
+    assert response["retcode"] == 0, response.get("message")
+    assert response["message"] == "success"
+    assert response["payload"] is not None
+
+
+def assert_cve(payload, cve_id):
+    """Assert a CVE-bearing payload refers to the expected id."""
+    assert payload.get("cve_id", cve_id) == cve_id
+    cve = payload.get("cve")
+    if cve is not None:
+        assert cve.get("id") == cve_id
+
+
+def _normalize_payload(result):
+    """Decode a string payload in place, exactly once.
+
+    Handlers normally return object payloads, but a double-encoding
+    handler would otherwise force every consumer into the
+    json.loads-if-isinstance-str dance — and re-parse multi-KB CVE
+    records at each use. Normalizing at the client means callers always
+    see a dict and the parse happens at most once per RPC.
+    """
+    payload = result.get("payload")
+    if isinstance(payload, str):
+        result["payload"] = _decode_json(payload)
+    return result
+
+
+class RequestLimiter:
+    """Bounds the number of in-flight RPCs issued by the test client.
+
+    Under pytest-xdist or thread-pool fan-out the tests can swamp the access
+    service and collapse its tail latency through queueing. A bounded
+    semaphore keeps concurrency at the server's sweet spot. This is the
+    single-host stand-in for a shared (e.g. Redis sorted-set) limiter; the
+    request_id bookkeeping mirrors that protocol so a distributed backend
+    can be swapped in without touching call sites.
+    """
+
+    def __init__(self, limit=8):
+        self._semaphore = threading.Semaphore(limit)
+        self._limit = limit
+        self._max = limit
+        # Permits withdrawn logically by shrink() but still held by
+        # in-flight requests; the release path absorbs them instead of
+        # returning the permit to the semaphore
+        self._deficit = 0
+        self._in_flight = set()
+        self._lock = threading.Lock()
+
+    def shrink(self):
+        """Halve the concurrency budget (multiplicative decrease on 429).
+
+        Free permits are withdrawn immediately; permits held by in-flight
+        requests are recorded as a deficit that the release path absorbs
+        as those requests finish. The logical limit therefore always
+        drops to the target at once — even when the limiter is fully
+        saturated, which is exactly when a 429 tends to arrive.
+        """
+        with self._lock:
+            target = max(1, self._limit // 2)
+            while self._limit > target:
+                if not self._semaphore.acquire(blocking=False):
+                    self._deficit += 1
+                self._limit -= 1
+
+    def grow(self):
+        """Restore one permit after a success (additive increase)."""
+        with self._lock:
+            if self._limit < self._max:
+                self._limit += 1
+                if self._deficit > 0:
+                    # Cancel a pending withdrawal instead of releasing:
+                    # the permit it was waiting to reclaim stays usable
+                    self._deficit -= 1
+                else:
+                    self._semaphore.release()
+
+    @contextlib.contextmanager
+    def acquire(self, request_id=None):
+        request_id = request_id or uuid.uuid4().hex
+        self._semaphore.acquire()
+        with self._lock:
+            self._in_flight.add(request_id)
+        try:
+            yield request_id
+        finally:
+            with self._lock:
+                self._in_flight.discard(request_id)
+                if self._deficit > 0:
+                    self._deficit -= 1
+                    release = False
+                else:
+                    release = True
+            if release:
+                self._semaphore.release()
+
+
+class AccessService:
+    """Thin REST client for the access service's /restful endpoints."""
+
+    # No per-instance __dict__: attribute access on the client sits on the
+    # hot path of every RPC in the suite, and slots also make accidental
+    # new attributes (typos, test-local monkey state) an immediate error.
+    # Class-level constants (_EMA_ALPHA etc.) live on the class as before.
+    __slots__ = (
+        "base_url",
+        "limiter",
+        "_cve_cache",
+        "rate_limit_ema",
+        "session",
+        "_executor",
+        "_health_cache",
+        "health_cache_hit",
+    )
+
+    # EMA weight for the rolling 429 signal; one throttled response pushes
+    # the average up by 0.1 and it decays back on successes
+    _EMA_ALPHA = 0.1
+
+    # Methods whose success changes the stored record for params["cve_id"];
+    # rpc_call evicts the client-side cache entry when it sees one go by
+    _CVE_MUTATORS = frozenset({"RPCCreateCVE", "RPCUpdateCVE", "RPCDeleteCVE"})
+
+    def __init__(self, base_url=ACCESS_BASE_URL):
+        self.base_url = base_url
+        self.limiter = RequestLimiter(limit=8)
+        # Front cache for get_cve keyed by CVE id: repeated reads of the
+        # same record within one test process skip the RPC and the JSON
+        # parse entirely. Kept coherent by the mutator eviction above —
+        # both write paths (rpc_call and rpc_call_batch, which the
+        # coalescer also uses) evict, so nothing can go stale.
+        self._cve_cache = {}
+        # Decaying average of recent rate-limit responses; pacing helpers
+        # consult it to slow down only while NVD is actually pushing back
+        self.rate_limit_ema = 0.0
+        # Keep-alive pool: dozens of sequential RPCs per test file would
+        # otherwise each pay a fresh TCP handshake. Pool size matches the
+        # limiter so every permitted in-flight request has a warm connection.
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=10, pool_maxsize=32, max_retries=0
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Background lane for prefetching: submit_rpc parks a call here so
+        # the caller can overlap Python-side work with the round trip
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+        # TTL memo for health(): (monotonic timestamp, payload), see below
+        self._health_cache = None
+        self.health_cache_hit = False
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        self.session.close()
+
+    # Liveness answers are stable for far longer than a test runs; cache
+    # window for health() below
+    _HEALTH_TTL = 30.0
+
+    def health(self, force_refresh=False):
+        """GET /restful/health, memoized for _HEALTH_TTL seconds.
+
+        Tests re-check liveness as a precondition far more often than the
+        answer can change; within the TTL the cached envelope is returned
+        without a network hop. health_cache_hit records which path served
+        the last call, and force_refresh=True always touches the wire —
+        readiness polling and the stability probe depend on that.
+        """
+        now = time.monotonic()
+        if not force_refresh and self._health_cache is not None:
+            cached_at, payload = self._health_cache
+            if now - cached_at < self._HEALTH_TTL:
+                self.health_cache_hit = True
+                return payload
+        response = self.session.get(f"{self.base_url}/restful/health", timeout=5)
+        payload = _decode_json(response.content)
+        self._health_cache = (now, payload)
+        self.health_cache_hit = False
+        return payload
+
+    def rpc_call(self, method, target="broker", params=None, timeout=30, verbose=True):
+        """POST an RPC envelope to /restful/rpc and return the decoded response."""
+        body = {"method": method, "target": target}
+        if params is not None:
+            body["params"] = params
+        if verbose:
+            sys.stdout.write(f"\n  → RPC {method} (target={target})\n")
+        data = _encode_json(body)
+        with self.limiter.acquire():
+            response = self.session.post(
+                f"{self.base_url}/restful/rpc", data=data,
+                headers=_JSON_HEADERS, timeout=timeout,
+            )
+        result = _normalize_payload(_decode_json(response.content))
+        if method in self._CVE_MUTATORS and params:
+            self._cve_cache.pop(params.get("cve_id"), None)
+        # Classify throttling once, here, where the wire format is known;
+        # every later is_rate_limited() on this response is a dict lookup
+        throttled = is_rate_limited(result)
+        result["_rate_limited"] = throttled
+        self.rate_limit_ema += self._EMA_ALPHA * (
+            (1.0 if throttled else 0.0) - self.rate_limit_ema
+        )
+        if verbose:
+            # One write per response instead of three: under pytest capture
+            # (and doubly under xdist) every print is a separate serialized
+            # syscall, and the formatting only happens on the verbose path
+            sys.stdout.write(
+                "  → Response received:\n"
+                f"    - retcode: {result.get('retcode')}\n"
+                f"    - message: {result.get('message')}\n"
+            )
+        return result
+
+    async def arpc_call(self, method, target="broker", params=None, timeout=30, verbose=True):
+        """Async wrapper around rpc_call.
+
+        Runs the blocking HTTP call on a worker thread so coroutine tests can
+        overlap independent RPCs with asyncio.gather; the limiter still
+        bounds total in-flight requests.
+        """
+        return await asyncio.to_thread(
+            self.rpc_call, method, target=target, params=params,
+            timeout=timeout, verbose=verbose,
+        )
+
+    def submit_rpc(self, method, target="broker", params=None, timeout=30):
+        """Start an rpc_call on a background thread and return its Future.
+
+        Lets a test kick off the next request (e.g. the following page of a
+        listing) while it is still asserting on the current response,
+        hiding one round trip per iteration behind work the test would do
+        anyway.
+        """
+        return self._executor.submit(
+            self.rpc_call, method, target=target, params=params,
+            timeout=timeout, verbose=False,
+        )
+
+    def get_cve(self, cve_id):
+        """Fetch a CVE through the meta service (local cache, NVD on miss).
+
+        Successful responses are cached in-process per CVE id; repeat reads
+        are a dict lookup instead of an RPC plus a full-record JSON parse.
+        """
+        hit = self._cve_cache.get(cve_id)
+        if hit is not None:
+            return hit
+        response = self.rpc_call("RPCGetCVE", target="meta", params={"cve_id": cve_id})
+        if response.get("retcode") == 0:
+            self._cve_cache[cve_id] = response
+        return response
+
+    @contextlib.contextmanager
+    def batched(self, max_batch=16, max_wait=0.01):
+        """Yield a coalescing client that merges concurrent calls.
+
+        Calls enqueued through the yielded client's rpc_call_async are
+        buffered for up to max_wait seconds (or max_batch entries) and
+        fired as one /restful/rpc/batch request; each caller gets a
+        Future resolved from the index-aligned response array. Pending
+        calls are flushed before the context exits.
+        """
+        client = BatchedAccessClient(self, max_batch=max_batch, max_wait=max_wait)
+        try:
+            yield client
+        finally:
+            client.close()
+
+    def rpc_call_batch(self, calls, timeout=60):
+        """POST several RPC envelopes in one round trip.
+
+        calls is a list of {"method", "target", "params"} dicts; the
+        gateway dispatches them in order and returns an index-aligned list
+        of response envelopes. Collapses N HTTP round trips (and their
+        per-request overhead) into one.
+        """
+        data = _encode_json(calls)
+        with self.limiter.acquire():
+            response = self.session.post(
+                f"{self.base_url}/restful/rpc/batch", data=data,
+                headers=_JSON_HEADERS, timeout=timeout,
+            )
+        results = _decode_json(response.content)
+        # Same cache coherence rule as rpc_call: a mutator going over the
+        # wire invalidates the cached record for its id, whichever path
+        # carried it — the batch delete workflow writes through here
+        for call in calls:
+            params = call.get("params")
+            if call.get("method") in self._CVE_MUTATORS and params:
+                self._cve_cache.pop(params.get("cve_id"), None)
+        if isinstance(results, list):
+            for result in results:
+                _normalize_payload(result)
+        return results
+
+    def list_cves_ids(self, offset, limit):
+        """List a page of CVEs but materialize only the ids and the total.
+
+        Assertions on list responses mostly touch payload["total"] and the
+        id of each entry; the descriptions, references and CPE matches that
+        dominate the payload (KB per record) are discarded unread. When
+        ijson is installed the response is parsed as a stream and only the
+        asserted fields are ever built as Python objects; otherwise the
+        full decode runs and the same shape is projected out of it.
+        """
+        body = _encode_json({
+            "method": "RPCListCVEs",
+            "target": "meta",
+            "params": {"offset": offset, "limit": limit},
+        })
+        with self.limiter.acquire():
+            response = self.session.post(
+                f"{self.base_url}/restful/rpc", data=body,
+                headers=_JSON_HEADERS, timeout=30, stream=True,
+            )
+        try:
+            if ijson is None:
+                result = _decode_json(response.content)
+                payload = result.get("payload") or {}
+                return {
+                    "total": payload.get("total"),
+                    "ids": [cve["id"] for cve in payload.get("cves") or []],
+                    "offset": offset,
+                    "limit": limit,
+                }
+            total = None
+            ids = []
+            for prefix, _event, value in ijson.parse(response.raw):
+                if prefix == "payload.total":
+                    total = value
+                elif prefix == "payload.cves.item.id":
+                    ids.append(value)
+            return {"total": total, "ids": ids, "offset": offset, "limit": limit}
+        finally:
+            response.close()
+
+    def get_message_stats(self):
+        return self.rpc_call("RPCGetMessageStats", target="broker")
+
+    def get_message_count(self):
+        return self.rpc_call("RPCGetMessageCount", target="broker")
+
+    def spawn_process(self, process_id, command, args=None, rpc=True):
+        """Ask the broker to spawn a subprocess (RPC transport by default)."""
+        params = {"id": process_id, "command": command, "args": args or []}
+        method = "RPCSpawnRPC" if rpc else "RPCSpawn"
+        return self.rpc_call(method, target="broker", params=params)
+
+
+# CVE ids shared by read/list/update tests; seeded once per module. Tests
+# that need a disposable CVE (e.g. delete flows) must pick ids outside this
+# set so they cannot invalidate the seed state.
+SEED_CVE_IDS = ("CVE-2021-44228", "CVE-2021-45046", "CVE-2022-22965")
+
+
+class BatchedAccessClient:
+    """Request-collapser over the gateway's batch endpoint.
+
+    Independent RPCs issued close together each paid a full HTTP round
+    trip. This client buffers calls from any thread in a queue; a daemon
+    flusher drains it whenever max_batch entries have accumulated or the
+    oldest entry has waited max_wait seconds, POSTs them as a single
+    /restful/rpc/batch envelope and resolves each caller's Future from
+    the index-aligned response array. Callers see the same envelopes
+    rpc_call would return — batching is transparent. Obtain one through
+    AccessService.batched(), which flushes and stops the flusher on exit.
+    """
+
+    def __init__(self, access, max_batch=16, max_wait=0.01):
+        self._access = access
+        self._max_batch = max_batch
+        self._max_wait = max_wait
+        self._queue = queue.Queue()
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(target=self._run, daemon=True)
+        self._flusher.start()
+
+    def rpc_call_async(self, method, target="broker", params=None):
+        """Enqueue a call and return a Future for its response envelope."""
+        future = concurrent.futures.Future()
+        self._queue.put((method, target, params, future))
+        return future
+
+    def close(self):
+        """Flush everything still queued and stop the flusher thread."""
+        self._closed.set()
+        self._flusher.join(timeout=10)
+
+    def _run(self):
+        while True:
+            try:
+                batch = [self._queue.get(timeout=0.05)]
+            except queue.Empty:
+                if self._closed.is_set():
+                    return
+                continue
+            deadline = time.monotonic() + self._max_wait
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._flush(batch)
+
+    def _flush(self, batch):
+        calls = [
+            {"method": method, "target": target, "params": params}
+            for method, target, params, _ in batch
+        ]
+        try:
+            responses = self._access.rpc_call_batch(calls)
+        except Exception as exc:  # resolve every waiter, never strand one
+            for _, _, _, future in batch:
+                future.set_exception(exc)
+            return
+        # The contract is an index-aligned array; anything else (the
+        # gateway's non-array 400 envelope, a truncated array) must fail
+        # every waiter instead of zipping futures to the wrong values or
+        # stranding the tail until its result() timeout expires
+        if not isinstance(responses, list) or len(responses) != len(batch):
+            exc = RuntimeError(
+                "batch endpoint returned %s of length %s for %d calls"
+                % (type(responses).__name__,
+                   len(responses) if isinstance(responses, list) else "n/a",
+                   len(batch))
+            )
+            for _, _, _, future in batch:
+                future.set_exception(exc)
+            return
+        for (_, _, _, future), response in zip(batch, responses):
+            future.set_result(response)
+
+
+def _probe_health(service):
+    try:
+        # Readiness must observe the real endpoint, never the TTL memo
+        return service.health(force_refresh=True).get("status") == "ok"
+    except requests.RequestException:
+        return False
+
+
+def _wait_for_health(service, timeout=30.0):
+    """Poll the health endpoint until the access service answers.
+
+    Exponential backoff from 10ms: the fixture proceeds within tens of
+    milliseconds of the gateway coming up, while a slow cold start is
+    probed at a gentle 500ms cadence instead of being hammered.
+    """
+    try:
+        wait_until(
+            lambda: _probe_health(service),
+            timeout=timeout, interval=0.01, max_interval=0.5,
+        )
+    except TimeoutError:
+        raise RuntimeError(
+            "access service did not become healthy in %.0fs" % timeout
+        ) from None
+
+
+@pytest.fixture(scope="session")
+def cve_db_path(tmp_path_factory):
+    """One CVE database file shared by the whole run.
+
+    Per-test temporary directories would rebuild the SQLite schema for
+    every test; a single session path pays schema init once, keeps the
+    page cache warm across tests, and still starts each CI run from a
+    clean file. Tests isolate themselves with unique CVE ids instead of
+    private databases.
+    """
+    return str(tmp_path_factory.mktemp("cve") / "test.db")
+
+
+def _spawn_broker(broker_bin, cve_db_path):
+    return subprocess.Popen(
+        [broker_bin],
+        cwd=PACKAGE_DIR,
+        env=dict(os.environ, CVE_DB_PATH=cve_db_path),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _stop_broker(broker):
+    broker.terminate()
+    try:
+        broker.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        broker.kill()
+        broker.wait()
+
+
+@contextlib.contextmanager
+def _file_lock(path):
+    """Exclusive cross-process lock via flock on a scratch file."""
+    fd = os.open(str(path), os.O_CREAT | os.O_RDWR, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+@pytest.fixture(scope="session")
+def access_service(cve_db_path, tmp_path_factory):
+    """Start the broker (which spawns all services) and yield a REST client.
+
+    Session-scoped: the broker spawn, service warm-up and client setup are
+    paid once for the whole run, and every rpc_call in every module reuses
+    the client's keep-alive pool instead of opening fresh connections. The
+    client itself is stateless, and tests clean up the CVE ids they create,
+    so sharing one stack across files is safe.
+
+    Under pytest-xdist each worker process evaluates its own session
+    fixtures, which would naively spawn one broker per worker — but the
+    gateway port and the UDS socket namespace are deterministic build-time
+    values (cmd/v2access/build_config.go and
+    cmd/v2broker/transport/build_config.go), so a second broker on the
+    same host just loses the bind race. Instead the workers share a
+    single stack: the first to win a file lock in the shared temp root
+    spawns the broker and records its pid, later workers reuse the
+    already-healthy gateway, and the last worker to finish its session
+    tears the broker down.
+    """
+    broker_bin = os.path.join(PACKAGE_DIR, "v2broker")
+    if not os.path.exists(broker_bin):
+        pytest.skip("v2broker binary not found; run ./build.sh -p first")
+
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker is None:
+        # Single-process run: own the whole lifecycle directly.
+        broker = _spawn_broker(broker_bin, cve_db_path)
+        service = AccessService()
+        try:
+            _wait_for_health(service)
+            yield service
+        finally:
+            service.close()
+            _stop_broker(broker)
+        return
+
+    # Workers get basetemp .../pytest-N/popen-gwX; the parent directory is
+    # the one path every worker of this run shares.
+    shared = tmp_path_factory.getbasetemp().parent
+    lock_path = shared / "v2e_broker.lock"
+    pid_path = shared / "v2e_broker.pid"
+    done_path = shared / "v2e_broker.done"
+
+    broker = None
+    with _file_lock(lock_path):
+        if not pid_path.exists():
+            # cve_db_path differs per worker, but only the spawning
+            # worker's path is ever used — the stack is shared.
+            broker = _spawn_broker(broker_bin, cve_db_path)
+            pid_path.write_text(str(broker.pid))
+
+    service = AccessService()
+    try:
+        _wait_for_health(service)
+        yield service
+    finally:
+        service.close()
+        with _file_lock(lock_path):
+            done = done_path.read_text().split() if done_path.exists() else []
+            done.append(worker)
+            done_path.write_text("\n".join(done))
+            total = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+            if len(done) >= total:
+                if broker is not None:
+                    _stop_broker(broker)
+                else:
+                    # The spawner finished earlier; signal by pid.
+                    with contextlib.suppress(ProcessLookupError):
+                        os.kill(int(pid_path.read_text()), signal.SIGTERM)
+
+
+@pytest.fixture(scope="session")
+def cve_cache():
+    """Cross-test cache of CVE payloads keyed by CVE id.
+
+    RPCCreateCVE already returns the stored record; keeping it here lets
+    read-only shape assertions reuse it instead of paying another
+    broker→meta→local round trip.
+    """
+    return {}
+
+
+@pytest.fixture(scope="class", params=["CVE-2022-22965"])
+def created_cve(access_service, request):
+    """Create one CVE per consuming class and delete it again at teardown.
+
+    Tests that only need 'some stored CVE' were each issuing their own
+    RPCCreateCVE (one NVD fetch apiece); class scope pays the fetch once
+    per class per id and hands the id to every test in the class. The id
+    is the update class's slice of the per-class CVE partitioning, so the
+    consumer can run on its own xdist worker without touching ids owned
+    by the create/read classes.
+    """
+    cve_id = request.param
+    response = ensure_cve(access_service, cve_id)
+    if is_rate_limited(response):
+        pytest.skip("NVD rate limited")
+    yield cve_id
+    access_service.rpc_call(
+        "RPCDeleteCVE", target="meta", params={"cve_id": cve_id}, verbose=False
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup(access_service):
+    """Pay cold-start costs before any test is timed.
+
+    The first RPC through a fresh stack also warms the gateway's connection
+    to the broker, cve-local's ORM metadata and prepared statements, and the
+    client's keep-alive pool; a cheap one-row list keeps that multi-second
+    hit out of the cache-latency assertions. Runs once per session, right
+    before the NVD probe.
+    """
+    access_service.rpc_call(
+        "RPCListCVEs", target="meta", params={"offset": 0, "limit": 1}, verbose=False
+    )
+
+
+@pytest.fixture(scope="session")
+def nvd_reachable(access_service, _warmup):
+    """Probe NVD once per session and cache whether it is answering.
+
+    The cached verdict lets every slow test decide to skip before issuing
+    its own NVD-bound RPC; on a throttled day the whole suite pays one
+    probe instead of one round trip per slow test.
+    """
+    response = access_service.rpc_call(
+        "RPCGetCVE", target="meta", params={"cve_id": SEED_CVE_IDS[0]}, verbose=False
+    )
+    return not is_rate_limited(response)
+
+
+@pytest.fixture(autouse=True)
+def _skip_if_nvd_throttled(request):
+    """Skip slow (NVD-dependent) tests immediately when the probe saw 429.
+
+    Fast tests still run: only the throttled upstream is unavailable, not
+    the local stack. Mid-run limits are still handled by the per-test
+    raise_if_rate_limited / batch skip paths. The probe fixture is pulled
+    in lazily, only for tests actually marked slow — naming nvd_reachable
+    as a parameter here would fire its NVD round trip on every run,
+    including the default -m "not slow" selection that must never spend
+    rate-limit budget.
+    """
+    if "slow" in request.keywords and not request.getfixturevalue("nvd_reachable"):
+        pytest.skip("NVD rate limited at session start")
+
+
+@pytest.fixture(scope="session")
+def seeded_cves(access_service):
+    """Create the shared test CVE ids once and return their create responses.
+
+    Every consumer would otherwise issue its own RPCCreateCVE for the same
+    handful of ids, multiplying NVD round trips and 429 skips.
+    """
+    cached = {}
+    for cve_id in SEED_CVE_IDS:
+        # ensure_cve pre-checks local storage, so re-runs against a warm
+        # database seed without spending any NVD budget
+        response = ensure_cve(access_service, cve_id)
+        if is_rate_limited(response):
+            pytest.skip("NVD rate limited while seeding shared CVEs")
+        cached[cve_id] = response
+    return cached
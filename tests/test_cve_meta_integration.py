@@ -0,0 +1,333 @@
+"""Service-level integration tests for cve-local and cve-remote.
+
+These exercise the storage and fetch services individually (target
+"local" / "remote") through the shared session broker stack, then chain
+them the way the meta service does. Every test reuses the one
+access_service fixture — no per-test process spawns or cold starts —
+and synthetic records use uuid-unique CVE ids so tests stay isolated
+without per-test databases.
+"""
+
+import logging
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from conftest import assert_ok, is_rate_limited
+from helpers import fetch_with_backoff, retry_rate_limited
+
+log = logging.getLogger(__name__)
+
+# Required-keys sets for the broker stats contract, built once at import:
+# a single set-difference replaces per-key membership asserts and a
+# failure names every missing key at once instead of just the first.
+_STATS_KEYS = frozenset({"total", "per_process"})
+_COUNT_KEYS = frozenset({"count"})
+
+
+def _synthetic_cve(cve_id):
+    """Minimal CVE object accepted by RPCSaveCVEByID."""
+    return {
+        "id": cve_id,
+        "descriptions": [
+            {"lang": "en", "value": "Synthetic record for integration tests"}
+        ],
+    }
+
+
+class TestServiceReadiness:
+    """Each broker-spawned service answers RPCs through the gateway.
+
+    One parametrized test instead of a structurally identical method per
+    service: the broker spawns every service itself at startup, so what
+    used to be per-service spawn-and-wait checks reduces to asserting
+    that each target is routable and responding.
+    """
+
+    @pytest.mark.parametrize("target,method", [
+        ("local", "RPCCountCVEs"),
+        ("meta", "RPCCountCVEs"),
+        ("broker", "RPCGetMessageCount"),
+    ])
+    def test_service_answers_rpc(self, access_service, target, method):
+        response = access_service.rpc_call(method, target=target, verbose=False)
+        assert response["retcode"] == 0
+
+    def test_gateway_deployment_healthy(self, access_service):
+        # The one deployment-health test: the session fixture already
+        # blocked until the gateway's first healthy answer, so a short
+        # stability burst is all that is left to assert. Bounded by probe
+        # count, not wall time: a throughput floor inside a timing window
+        # turns scheduler noise on a loaded CI runner into flakes, while
+        # five consecutive successful probes catch a gateway that stalls
+        # or flaps just as well and never depend on per-call latency
+        for _ in range(5):
+            # force_refresh bypasses the client's TTL memo — counting
+            # cache hits would say nothing about the gateway
+            assert access_service.health(force_refresh=True)["status"] == "ok"
+
+
+class TestBrokerStatsContract:
+    """Broker observability RPCs keep their documented payload shape.
+
+    One parametrized contract test instead of a method per RPC: each row
+    is (method, expected success, required payload keys), so adding a
+    stats endpoint to the contract is a one-line change and pytest still
+    reports each method separately.
+    """
+
+    @pytest.mark.parametrize("method,expect_ok,keys", [
+        ("RPCGetMessageStats", True, _STATS_KEYS),
+        ("RPCGetMessageCount", True, _COUNT_KEYS),
+        ("RPCNoSuchMethod", False, frozenset()),
+    ])
+    def test_rpc_contract(self, access_service, method, expect_ok, keys):
+        response = access_service.rpc_call(method, target="broker", verbose=False)
+        if not expect_ok:
+            assert response["retcode"] != 0
+            return
+        assert response["retcode"] == 0
+        missing = keys - response["payload"].keys()
+        assert not missing, f"{method} payload missing keys: {sorted(missing)}"
+
+
+class TestBrokerThroughput:
+    """Broker routing stays correct under concurrent gateway load."""
+
+    def test_concurrent_message_count(self, access_service):
+        # Serial dispatch would measure nothing but round-trip latency;
+        # overlapping the calls exercises the broker's actual routing
+        # throughput. The client's RequestLimiter still caps in-flight
+        # requests at the server's sweet spot, so 16 workers feed the
+        # pool without swamping the gateway.
+        num_requests = 50
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            futures = [
+                pool.submit(
+                    access_service.rpc_call, "RPCGetMessageCount",
+                    target="broker", verbose=False,
+                )
+                for _ in range(num_requests)
+            ]
+            responses = [future.result() for future in futures]
+        elapsed = time.perf_counter() - t0
+
+        for response in responses:
+            assert response["retcode"] == 0
+        log.info(
+            "%d concurrent RPCs in %.3fs (%.0f req/s)",
+            num_requests, elapsed, num_requests / elapsed,
+        )
+
+    def test_coalesced_message_count(self, access_service):
+        # The coalescer buffers calls landing within a 10ms window and
+        # fires them as single /rpc/batch envelopes; callers just await
+        # futures, so N logical RPCs cost a handful of HTTP round trips
+        num_requests = 20
+        with access_service.batched() as batched:
+            futures = [
+                batched.rpc_call_async("RPCGetMessageCount", target="broker")
+                for _ in range(num_requests)
+            ]
+            responses = [future.result(timeout=30) for future in futures]
+
+        assert len(responses) == num_requests
+        for response in responses:
+            assert response["retcode"] == 0
+
+
+class TestCVELocalStorage:
+    """cve-local save/check/delete against the shared stack, no NVD."""
+
+    def test_cve_local_save_and_check(self, access_service):
+        cve_id = f"CVE-2021-{uuid.uuid4().hex[:6].upper()}"
+
+        save_response = access_service.rpc_call(
+            "RPCSaveCVEByID", target="local",
+            params={"cve": _synthetic_cve(cve_id)}, verbose=False,
+        )
+        assert_ok(save_response)
+        assert save_response["payload"]["cve_id"] == cve_id
+
+        check_response = access_service.rpc_call(
+            "RPCIsCVEStoredByID", target="local",
+            params={"cve_id": cve_id}, verbose=False,
+        )
+        assert_ok(check_response)
+        assert check_response["payload"]["stored"] is True
+
+        delete_response = access_service.rpc_call(
+            "RPCDeleteCVEByID", target="local",
+            params={"cve_id": cve_id}, verbose=False,
+        )
+        assert_ok(delete_response)
+        assert delete_response["payload"]["stored_after"] is False
+
+    def test_batch_get_mixed_ids(self, access_service):
+        cve_id = f"CVE-2021-{uuid.uuid4().hex[:6].upper()}"
+        save_response = access_service.rpc_call(
+            "RPCSaveCVEByID", target="local",
+            params={"cve": _synthetic_cve(cve_id)}, verbose=False,
+        )
+        assert_ok(save_response)
+
+        # One round trip probes a stored id, an absent id and a malformed
+        # id together; misses come back per entry, not as batch failures
+        response = access_service.rpc_call(
+            "RPCBatchGetCVE", target="local",
+            params={"cve_ids": [cve_id, "CVE-1900-0000", "not-a-cve"]},
+            verbose=False,
+        )
+        assert_ok(response)
+        payload = response["payload"]
+        assert payload["count"] == 3
+        assert payload["found"] == 1
+
+        stored, absent, malformed = payload["results"]
+        assert stored["found"] is True
+        assert stored["cve"]["id"] == cve_id
+        assert absent["found"] is False and absent.get("error")
+        assert malformed["found"] is False and malformed.get("error")
+
+        access_service.rpc_call(
+            "RPCDeleteCVEByID", target="local",
+            params={"cve_id": cve_id}, verbose=False,
+        )
+
+    def test_cve_local_count_tracks_saves(self, access_service):
+        cve_id = f"CVE-2021-{uuid.uuid4().hex[:6].upper()}"
+
+        before = access_service.rpc_call(
+            "RPCCountCVEs", target="local", verbose=False
+        )
+        assert_ok(before)
+
+        access_service.rpc_call(
+            "RPCSaveCVEByID", target="local",
+            params={"cve": _synthetic_cve(cve_id)}, verbose=False,
+        )
+        after = access_service.rpc_call(
+            "RPCCountCVEs", target="local", verbose=False
+        )
+        assert_ok(after)
+        # The count is a global view: under xdist, fast tests on other
+        # workers (e.g. the batched-pages list test) save and delete their
+        # own synthetic rows between these two calls, so exact +1 math is
+        # racy. The per-id stored check below is the deterministic
+        # assertion; the count is only held to not shrinking.
+        assert after["payload"]["count"] >= before["payload"]["count"]
+        check = access_service.rpc_call(
+            "RPCIsCVEStoredByID", target="local",
+            params={"cve_id": cve_id}, verbose=False,
+        )
+        assert_ok(check)
+        assert check["payload"]["stored"] is True
+
+        access_service.rpc_call(
+            "RPCDeleteCVEByID", target="local",
+            params={"cve_id": cve_id}, verbose=False,
+        )
+
+
+class TestCVERemoteFetch:
+    """cve-remote NVD fetches through the shared stack."""
+
+    @pytest.mark.slow
+    @pytest.mark.timeout(120)
+    def test_cve_remote_get_count(self, access_service):
+        # Adaptive timeouts (fetch_with_backoff) surface a hung NVD in
+        # seconds instead of a flat worst-case budget, and the AIMD
+        # retry keeps throttled calls in place instead of skipping on
+        # the first 429
+        response = retry_rate_limited(
+            lambda: fetch_with_backoff(
+                access_service, "RPCGetCVECnt", target="remote"
+            ),
+            limiter=access_service.limiter,
+        )
+        assert_ok(response)
+        assert response["payload"]["total_results"] > 0
+
+    @pytest.mark.slow
+    @pytest.mark.timeout(120)
+    def test_cve_remote_get_by_id(self, access_service):
+        cve_id = "CVE-2021-44228"
+        response = retry_rate_limited(
+            lambda: fetch_with_backoff(
+                access_service, "RPCGetCVEByID", target="remote",
+                params={"cve_id": cve_id},
+            ),
+            limiter=access_service.limiter,
+        )
+        assert_ok(response)
+        vulnerabilities = response["payload"]["vulnerabilities"]
+        assert vulnerabilities
+        assert vulnerabilities[0]["cve"]["id"] == cve_id
+
+
+class TestCVERemoteToLocal:
+    """The fetch-then-store chain the meta service drives in production."""
+
+    @pytest.mark.slow
+    @pytest.mark.timeout(60)
+    def test_cve_integration_remote_to_local(self, access_service):
+        cve_id = "CVE-2021-44228"
+
+        # One client round trip instead of three: meta's RPCBatchPipeline
+        # runs the dependent chain on internal broker hops, threading the
+        # remote fetch result into the local save via input_from
+        response = access_service.rpc_call(
+            "RPCBatchPipeline", target="meta",
+            params={"steps": [
+                {"method": "RPCGetCVEByID", "target": "remote",
+                 "params": {"cve_id": cve_id}},
+                {"method": "RPCSaveCVEByID", "target": "local",
+                 "input_from": 0, "output_key": "vulnerabilities.0.cve",
+                 "input_key": "cve"},
+                {"method": "RPCIsCVEStoredByID", "target": "local",
+                 "params": {"cve_id": cve_id}},
+            ]},
+            verbose=False,
+        )
+        if is_rate_limited(response):
+            pytest.skip("NVD rate limited")
+        assert_ok(response)
+
+        fetch_step, save_step, check_step = response["payload"]["steps"]
+        # A throttled NVD fetch surfaces as a step-level error, not an
+        # envelope-level one; skip instead of failing on rate pressure
+        fetch_error = fetch_step.get("error")
+        if fetch_error and ("429" in fetch_error or "RATE_LIMITED" in fetch_error):
+            pytest.skip("NVD rate limited")
+        assert not fetch_error
+        assert not save_step.get("error")
+        assert check_step["payload"]["stored"] is True
+        log.info("pipelined fetch/save/check for %s in one round trip", cve_id)
+
+    @pytest.mark.slow
+    @pytest.mark.timeout(60)
+    def test_batch_fetch_duplicate_already_stored(self, access_service):
+        # Id not shared with any other module, so no concurrent delete can
+        # race the duplicate check under xdist
+        cve_id = "CVE-2021-45105"
+
+        # One request for both ids; meta processes them in order, so the
+        # duplicate must observe the first occurrence as already stored
+        response = access_service.rpc_call(
+            "RPCBatchFetchCVEs", target="meta",
+            params={"cve_ids": [cve_id, cve_id]}, verbose=False,
+        )
+        if is_rate_limited(response):
+            pytest.skip("NVD rate limited")
+        assert_ok(response)
+
+        first, second = response["payload"]["results"]
+        first_error = first.get("error")
+        if first_error and ("429" in first_error or "RATE_LIMITED" in first_error):
+            pytest.skip("NVD rate limited")
+        assert not first_error
+        assert not second.get("error")
+        assert second["already_stored"] is True
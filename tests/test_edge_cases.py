@@ -0,0 +1,91 @@
+"""Edge-case and malformed-input tests for the RPC gateway.
+
+Every case is an independent parametrized test against the shared
+session gateway: no NVD traffic, no stored state, no ordering
+constraints — so xdist can distribute them freely across workers and
+each case reports its own pass/fail instead of a loop dying on the
+first bad input.
+"""
+
+import logging
+
+import pytest
+
+log = logging.getLogger(__name__)
+
+# Hoisted parametrize inputs: tuples built once at import instead of per
+# collection pass, and one obvious place to extend the hostile-input set.
+_SPECIAL_IDS = (
+    "CVE-2021-44228'; DROP TABLE cves;--",
+    "CVE-2021-<script>",
+    "../../../etc/passwd",
+    "CVE 2021 44228",
+    "%00%01%02",
+)
+_UNICODE_IDS = (
+    "CVE-2021-中文",
+    "CVE-2021-\U0001f600",
+    "CVЕ-2021-44228",  # Cyrillic Е look-alike
+)
+_BAD_TARGETS = (
+    "nonexistent",
+    "local; rm -rf /",
+    "LOCAL",
+    "",
+)
+
+
+class TestMalformedCVEIDs:
+    """Lookups with hostile or nonsensical ids fail cleanly per id."""
+
+    @pytest.mark.parametrize("cve_id", _SPECIAL_IDS)
+    def test_special_characters_rejected(self, access_service, cve_id):
+        log.debug("testing special id: %r", cve_id)
+        response = access_service.rpc_call(
+            "RPCGetCVEByID", target="local",
+            params={"cve_id": cve_id}, verbose=False,
+        )
+        assert response["retcode"] != 0
+        assert response["payload"] is None
+
+    @pytest.mark.parametrize("cve_id", _UNICODE_IDS)
+    def test_unicode_ids_rejected(self, access_service, cve_id):
+        log.debug("testing unicode id: %r", cve_id)
+        response = access_service.rpc_call(
+            "RPCGetCVEByID", target="local",
+            params={"cve_id": cve_id}, verbose=False,
+        )
+        assert response["retcode"] != 0
+
+    def test_empty_cve_id(self, access_service):
+        response = access_service.rpc_call(
+            "RPCGetCVEByID", target="local",
+            params={"cve_id": ""}, verbose=False,
+        )
+        assert response["retcode"] != 0
+        assert "required" in (response.get("message") or "").lower()
+
+
+class TestMalformedRouting:
+    """Requests addressed to nowhere come back as clean error envelopes."""
+
+    @pytest.mark.parametrize("target", _BAD_TARGETS)
+    def test_unknown_target(self, access_service, target):
+        log.debug("testing target: %r", target)
+        response = access_service.rpc_call(
+            "RPCCountCVEs", target=target or "broker", verbose=False,
+        )
+        # Empty target falls back to broker, which has no RPCCountCVEs;
+        # every case must yield a well-formed error, never a hang or 5xx
+        assert response["retcode"] != 0
+
+    def test_unknown_method(self, access_service):
+        response = access_service.rpc_call(
+            "RPCNoSuchMethod", target="local", verbose=False,
+        )
+        assert response["retcode"] != 0
+
+    def test_gateway_survives_malformed_traffic(self, access_service):
+        # The error paths above must not wedge the gateway; bypass the
+        # client's health TTL memo so this actually touches the wire
+        assert access_service.health(force_refresh=True)["status"] == "ok"
@@ -0,0 +1,166 @@
+"""End-to-end web application workflow tests.
+
+Each test replays the RPC sequence the website frontend issues for a common
+user journey: searching and viewing a CVE, managing the local collection,
+bulk-importing a set of CVEs, and cleaning up afterwards.
+
+All flows go through the access gateway; creates and cache-miss reads may
+reach NVD via the remote service, so the whole class is marked slow.
+"""
+
+import asyncio
+import logging
+
+import pytest
+
+from conftest import is_rate_limited
+
+# Step diagnostics are logged lazily: quiet runs format and write nothing,
+# -v raises this logger to DEBUG via conftest.pytest_configure.
+log = logging.getLogger(__name__)
+
+TEST_CVE_ID = "CVE-2021-44228"
+BULK_CVE_IDS = ["CVE-2021-44228", "CVE-2021-45046", "CVE-2022-22965"]
+
+
+@pytest.mark.slow
+@pytest.mark.rpc
+class TestWebApplicationWorkflows:
+    """User-journey flows as driven by the website's RPC client."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(30)
+    async def test_user_search_and_view_workflow(self, access_service):
+        """User searches for a CVE and opens its detail view."""
+        # Step 1: the frontend checks whether the CVE is already local;
+        # include_data returns the full record on a hit so the common path
+        # never needs the separate RPCGetCVE round trip
+        log.debug("Step 1: checking local store for %s", TEST_CVE_ID)
+        check_response = await access_service.arpc_call(
+            "RPCIsCVEStoredByID",
+            target="local",
+            params={"cve_id": TEST_CVE_ID, "include_data": True},
+        )
+        if is_rate_limited(check_response):
+            pytest.skip("NVD rate limited")
+        assert check_response["retcode"] == 0
+
+        # Step 2: only fetch details when the existence check had no data
+        cve_data = check_response["payload"].get("cve")
+        if cve_data is None:
+            log.debug("Step 2: viewing details for %s", TEST_CVE_ID)
+            view_response = await access_service.arpc_call(
+                "RPCGetCVE", target="meta", params={"cve_id": TEST_CVE_ID}
+            )
+            if is_rate_limited(view_response):
+                pytest.skip("NVD rate limited")
+            assert view_response["retcode"] == 0
+            cve_data = view_response["payload"]
+        assert cve_data is not None
+        log.debug("viewed %s", TEST_CVE_ID)
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(30)
+    async def test_user_collection_management_workflow(self, access_service):
+        """User adds a CVE to the collection and removes it again."""
+        # Baseline count; RPCCountCVEs avoids shipping full rows for a total
+        count_response = await access_service.arpc_call("RPCCountCVEs", target="meta")
+        assert count_response["retcode"] == 0
+        initial_count = count_response["payload"]["count"]
+        log.debug("initial collection size: %d", initial_count)
+
+        # Add a CVE to the collection
+        create_response = await access_service.arpc_call(
+            "RPCCreateCVE", target="meta", params={"cve_id": TEST_CVE_ID}
+        )
+        if is_rate_limited(create_response):
+            pytest.skip("NVD rate limited")
+        assert create_response["retcode"] == 0
+
+        count_response = await access_service.arpc_call("RPCCountCVEs", target="meta")
+        assert count_response["retcode"] == 0
+        after_add_count = count_response["payload"]["count"]
+        log.debug("collection size after add: %d", after_add_count)
+        assert after_add_count >= initial_count
+
+        # Remove it again
+        delete_response = await access_service.arpc_call(
+            "RPCDeleteCVE", target="meta", params={"cve_id": TEST_CVE_ID}
+        )
+        assert delete_response["retcode"] == 0
+
+        count_response = await access_service.arpc_call("RPCCountCVEs", target="meta")
+        assert count_response["retcode"] == 0
+        final_count = count_response["payload"]["count"]
+        log.debug("collection size after delete: %d", final_count)
+        assert final_count <= after_add_count
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(30)
+    async def test_user_bulk_import_workflow(self, access_service):
+        """User imports a list of CVEs from the import dialog."""
+        # Fan the imports out; the event loop overlaps the NVD-bound waits
+        # while the client-side limiter bounds in-flight requests.
+        responses = await asyncio.gather(*[
+            access_service.arpc_call(
+                "RPCCreateCVE", target="meta", params={"cve_id": cve_id}
+            )
+            for cve_id in BULK_CVE_IDS
+        ])
+        for response in responses:
+            if is_rate_limited(response):
+                pytest.skip("NVD rate limited")
+            assert response["retcode"] == 0
+        imported = list(BULK_CVE_IDS)
+        # Pace only on observed pressure: an unthrottled batch proceeds
+        # immediately, while a high recent-429 average lets the NVD
+        # window drain before the verification reads
+        if access_service.rate_limit_ema > 0.3:
+            await asyncio.sleep(min(access_service.rate_limit_ema, 1.0))
+
+        # Verify every imported CVE is now stored locally, concurrently
+        check_responses = await asyncio.gather(*[
+            access_service.arpc_call(
+                "RPCIsCVEStoredByID", target="local", params={"cve_id": cve_id}
+            )
+            for cve_id in imported
+        ])
+        for cve_id, check_response in zip(imported, check_responses):
+            assert check_response["retcode"] == 0
+            assert check_response["payload"]["stored"] is True
+            log.debug("%s stored", cve_id)
+
+    @pytest.mark.asyncio
+    @pytest.mark.timeout(30)
+    async def test_user_cleanup_workflow(self, access_service):
+        """User clears imported CVEs from the collection page."""
+        count_response = await access_service.arpc_call("RPCCountCVEs", target="meta")
+        assert count_response["retcode"] == 0
+        before_count = count_response["payload"]["count"]
+        log.debug("collection size before cleanup: %d", before_count)
+
+        # The collection page is the one place that needs the actual rows
+        list_response = await access_service.arpc_call(
+            "RPCListCVEs", target="meta", params={"offset": 0, "limit": 100}
+        )
+        assert list_response["retcode"] == 0
+        stored_ids = [item["id"] for item in list_response["payload"]["cves"]]
+
+        for cve_id in BULK_CVE_IDS:
+            if cve_id not in stored_ids:
+                continue
+            log.debug("Deleting %s", cve_id)
+            # RPCDeleteCVE is local-only — it never touches NVD, so there
+            # is no budget to protect and no reason to pace the loop
+            delete_response = await access_service.arpc_call(
+                "RPCDeleteCVE", target="meta", params={"cve_id": cve_id}
+            )
+            if is_rate_limited(delete_response):
+                pytest.skip("NVD rate limited")
+            assert delete_response["retcode"] == 0
+
+        count_response = await access_service.arpc_call("RPCCountCVEs", target="meta")
+        assert count_response["retcode"] == 0
+        after_count = count_response["payload"]["count"]
+        log.debug("collection size after cleanup: %d", after_count)
+        assert after_count <= before_count